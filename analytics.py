@@ -0,0 +1,117 @@
+import os
+import tempfile
+
+import numpy as np
+
+import seed_engine
+
+# Per-range results are saved here as .npy files named by minute range
+CACHE_DIR = os.path.join(seed_engine.DATA_DIR, "reachability")
+
+# One row per seed: how many minutes in the range produce it, and the first
+# and last of them (-1 when the seed is unreachable)
+STATS_DTYPE = np.dtype([('count', '<u4'), ('earliest', '<i4'), ('latest', '<i4')])
+
+# Minutes counted per step
+CHUNK_MINUTES = seed_engine.DAYS_PER_CHUNK * seed_engine.MINUTES_PER_DAY
+
+
+def cache_path(first_minute, end_minute):
+    return os.path.join(CACHE_DIR, f"seeds_{first_minute}_{end_minute}.npy")
+
+
+def _load_cached(path):
+    # A cached STATS_DTYPE array, or None if it is missing, cut short by an
+    # interrupted write, or not what this version writes
+    try:
+        stats = np.load(path)
+    except (OSError, ValueError, EOFError):
+        return None
+    if stats.dtype != STATS_DTYPE or stats.shape != (seed_engine.SEED_SPACE,):
+        return None
+    return stats
+
+
+def _save_cached(path, stats):
+    # Written to a temp file and moved into place, so an interrupted write
+    # never leaves a partial cache file behind
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(suffix=".npy.tmp", dir=CACHE_DIR)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, stats)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+
+
+def _first_occurrences(found, chunk_start, seeds, reverse=False):
+    # Fill `found` for the seeds in this chunk it doesn't have yet.
+    # np.unique's index is the first occurrence; on the reversed chunk it
+    # is the last one.
+    values, index = np.unique(seeds[::-1] if reverse else seeds, return_index=True)
+    if reverse:
+        index = seeds.size - 1 - index
+    new = found[values] < 0
+    found[values[new]] = chunk_start + index[new]
+
+
+def iter_reachability(first_minute=0, end_minute=seed_engine.MINUTE_COUNT, use_cache=True,
+                      source=seed_engine.seeds_for_range):
+    """Yield (fraction done, stats or None); the last item carries the STATS_DTYPE array
+
+    A range computed before is read back from the disk cache. source(start,
+    count) supplies the seeds, e.g. the get of a SharedSeeds block that
+    already holds the range.
+    """
+    count = end_minute - first_minute
+    seed_engine.check_range(first_minute, count)
+    path = cache_path(first_minute, end_minute)
+    if use_cache:
+        stats = _load_cached(path)
+        if stats is not None:
+            yield 1.0, stats
+            return
+
+    # One pass for the histogram; the first occurrences come from the first
+    # chunks that contain each seed, so the unique() calls stop early
+    counts = np.zeros(seed_engine.SEED_SPACE, dtype=np.int64)
+    earliest = np.full(seed_engine.SEED_SPACE, -1, dtype=np.int64)
+    chunk_starts = []
+    for chunk_start in range(first_minute, end_minute, CHUNK_MINUTES):
+        seeds = source(chunk_start, min(CHUNK_MINUTES, end_minute - chunk_start))
+        chunk_starts.append((chunk_start, seeds.size))
+        counts += np.bincount(seeds, minlength=seed_engine.SEED_SPACE)
+        if (earliest < 0).any():
+            _first_occurrences(earliest, chunk_start, seeds)
+        yield 0.9 * (chunk_start + seeds.size - first_minute) / count, None
+
+    # The last occurrences come from walking back from the end until every
+    # reachable seed has one
+    latest = np.full(seed_engine.SEED_SPACE, -1, dtype=np.int64)
+    reachable = counts > 0
+    for chunk_start, size in reversed(chunk_starts):
+        if not (reachable & (latest < 0)).any():
+            break
+        _first_occurrences(latest, chunk_start, source(chunk_start, size), reverse=True)
+
+    stats = np.empty(seed_engine.SEED_SPACE, dtype=STATS_DTYPE)
+    stats['count'] = counts
+    stats['earliest'] = earliest
+    stats['latest'] = latest
+    if use_cache:
+        _save_cached(path, stats)
+    yield 1.0, stats
+
+
+def reachability(first_minute=0, end_minute=seed_engine.MINUTE_COUNT, use_cache=True,
+                 source=seed_engine.seeds_for_range):
+    """STATS_DTYPE array for every seed over [first_minute, end_minute)"""
+    for _, stats in iter_reachability(first_minute, end_minute, use_cache, source):
+        pass
+    return stats
+
+
+def unreachable_seeds(stats):
+    return np.flatnonzero(stats['count'] == 0)
@@ -0,0 +1,88 @@
+import queue
+import threading
+
+
+class BackgroundJob:
+    """Run a generator on a worker thread and feed its output back to Tk
+
+    `work` is a generator function yielding (progress, chunk) pairs, with
+    progress in 0..1 and chunk any result object (or None for a progress-only
+    update). Items travel through a queue that the Tk loop drains with
+    root.after, so every callback runs on the UI thread.
+    """
+
+    POLL_MS = 30
+    QUEUE_SIZE = 8
+
+    def __init__(self, root, work, on_chunk=None, on_progress=None, on_done=None, on_error=None):
+        self.root = root
+        self.work = work
+        self.on_chunk = on_chunk
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.cancelled = threading.Event()
+        self.queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.thread = threading.Thread(target=self._run, daemon=True)
+        self._poll_id = None
+
+    def start(self):
+        self.thread.start()
+        self._poll_id = self.root.after(self.POLL_MS, self._poll)
+        return self
+
+    def cancel(self):
+        """Abandon the job; nothing it produces after this reaches the UI"""
+        self.cancelled.set()
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+
+    @property
+    def running(self):
+        return self._poll_id is not None
+
+    def _put(self, message):
+        # Block while the UI catches up, but give up as soon as we're cancelled
+        while not self.cancelled.is_set():
+            try:
+                self.queue.put(message, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def _run(self):
+        generator = self.work()
+        try:
+            for progress, chunk in generator:
+                if not self._put(('chunk', (progress, chunk))):
+                    return
+            self._put(('done', None))
+        except Exception as e:
+            self._put(('error', e))
+        finally:
+            generator.close()
+
+    def _poll(self):
+        self._poll_id = None
+        while not self.cancelled.is_set():
+            try:
+                kind, payload = self.queue.get_nowait()
+            except queue.Empty:
+                self._poll_id = self.root.after(self.POLL_MS, self._poll)
+                return
+            if kind == 'chunk':
+                progress, chunk = payload
+                if chunk is not None and self.on_chunk:
+                    self.on_chunk(chunk)
+                if self.on_progress:
+                    self.on_progress(progress)
+            elif kind == 'done':
+                if self.on_done:
+                    self.on_done()
+                return
+            else:
+                if self.on_error:
+                    self.on_error(payload)
+                return
@@ -0,0 +1,165 @@
+"""Batch reverse lookup: python batch_lookup.py targets.txt --first-year 2000 --last-year 2010 -o matches.csv
+
+The targets file holds hex seeds separated by whitespace or commas; text after
+a '#' is ignored. Every clock setting in the year range that produces one of
+the targets is written out, grouped by seed.
+"""
+import argparse
+import re
+import sys
+
+import numpy as np
+
+import reverse_index
+import seed_engine
+import seed_export
+
+FORMATS = ('csv', 'jsonl')
+
+MATCH_DTYPE = np.dtype([('seed', '<u2'), ('minute', '<u4')])
+
+# Targets per progress step when reading from the reverse index
+TARGETS_PER_STEP = 256
+
+# Rows per formatted output chunk
+FORMAT_CHUNK = 1 << 16
+
+
+def parse_targets(text):
+    """Sorted, de-duplicated uint16 array of the hex seeds in `text`"""
+    seeds = []
+    for line_number, line in enumerate(text.splitlines(), 1):
+        for token in re.split(r"[\s,;]+", line.split('#', 1)[0]):
+            if not token:
+                continue
+            try:
+                seed = int(token, 16)
+            except ValueError:
+                seed = None
+            if seed is None or not (0 <= seed < seed_engine.SEED_SPACE):
+                raise ValueError(f"line {line_number}: {token!r} is not a seed between 0000 and FFFF")
+            seeds.append(seed)
+    return np.unique(np.array(seeds, dtype=seed_engine.SEED_DTYPE))
+
+
+def read_targets(path):
+    with open(path) as f:
+        return parse_targets(f.read())
+
+
+def _from_index(targets, first_minute, end_minute, index):
+    # Each target is one bucket slice, trimmed to the range by binary search
+    for step in range(0, targets.size, TARGETS_PER_STEP):
+        parts = []
+        for seed in targets[step:step + TARGETS_PER_STEP].tolist():
+            minutes = index.minutes_for_seed(seed)
+            lo, hi = np.searchsorted(minutes, [first_minute, end_minute])
+            part = np.empty(hi - lo, dtype=MATCH_DTYPE)
+            part['seed'] = seed
+            part['minute'] = minutes[lo:hi]
+            parts.append(part)
+        yield min(step + TARGETS_PER_STEP, targets.size) / targets.size, np.concatenate(parts)
+
+
+def _sweep(targets, first_minute, end_minute):
+    # One pass over the timeline; membership is a single table read per
+    # minute, so the cost doesn't grow with the number of targets
+    wanted = np.zeros(seed_engine.SEED_SPACE, dtype=bool)
+    wanted[targets] = True
+    count = end_minute - first_minute
+    for chunk_start, seeds in seed_engine.iter_seed_chunks(first_minute, count):
+        offsets = np.flatnonzero(wanted[seeds])
+        part = np.empty(offsets.size, dtype=MATCH_DTYPE)
+        part['seed'] = seeds[offsets]
+        part['minute'] = chunk_start + offsets
+        yield (chunk_start + seeds.size - first_minute) / count, part
+
+
+def iter_lookup(targets, first_minute=0, end_minute=seed_engine.MINUTE_COUNT, index=None):
+    """Yield (fraction done, matches) for every minute in range giving a target
+
+    Matches are MATCH_DTYPE arrays. With a reverse index they come per seed,
+    otherwise the range is swept once and they come in minute order.
+    """
+    seed_engine.check_range(first_minute, end_minute - first_minute)
+    targets = np.unique(np.asarray(targets, dtype=seed_engine.SEED_DTYPE))
+    if targets.size == 0 or end_minute == first_minute:
+        return
+    if index is not None:
+        yield from _from_index(targets, first_minute, end_minute, index)
+    else:
+        yield from _sweep(targets, first_minute, end_minute)
+
+
+def collect(parts):
+    """Join the parts from iter_lookup, sorted by seed, then minute"""
+    matches = np.concatenate(parts) if parts else np.empty(0, dtype=MATCH_DTYPE)
+    # Both paths already give each seed's minutes in order, so a stable sort
+    # on the seed alone is enough (and far cheaper than a structured sort)
+    return matches[np.argsort(matches['seed'], kind='stable')]
+
+
+def lookup(targets, first_minute=0, end_minute=seed_engine.MINUTE_COUNT, index=None):
+    """All matches sorted by seed, then minute"""
+    return collect([part for _, part in iter_lookup(targets, first_minute, end_minute, index)])
+
+
+def iter_format(matches, fmt):
+    """Yield the matches as encoded CSV or JSONL chunks"""
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    if fmt == 'csv':
+        yield b"seed,datetime\n"
+        line_format = "{},{}T{}\n"
+    else:
+        line_format = '{{"seed": "{}", "datetime": "{}T{}"}}\n'
+    for position in range(0, matches.size, FORMAT_CHUNK):
+        chunk = matches[position:position + FORMAT_CHUNK]
+        days, minutes_of_day = np.divmod(chunk['minute'], seed_engine.MINUTES_PER_DAY)
+        lines = [line_format.format(seed_export.HEX_STRINGS[seed], seed_engine.date_string(day),
+                                    seed_engine.TIME_STRINGS[minute_of_day])
+                 for seed, day, minute_of_day in zip(chunk['seed'].tolist(), days.tolist(), minutes_of_day.tolist())]
+        yield "".join(lines).encode("ascii")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the clock settings for a file of target seeds")
+    parser.add_argument('targets', help="file of hex seeds")
+    parser.add_argument('--first-year', type=int, default=seed_engine.FIRST_YEAR)
+    parser.add_argument('--last-year', type=int, default=seed_engine.LAST_YEAR)
+    parser.add_argument('--format', choices=FORMATS, default='csv')
+    parser.add_argument('--output', '-o', help="output file (default: stdout)")
+    parser.add_argument('--index', action='store_true',
+                        help="read from the reverse index, building it if needed")
+    args = parser.parse_args(argv)
+
+    try:
+        targets = read_targets(args.targets)
+        first_minute, end_minute = seed_engine.year_range(args.first_year, args.last_year)
+    except (OSError, ValueError) as e:
+        parser.error(str(e))
+
+    # An index that already exists is always worth using; otherwise one sweep
+    # is cheaper than building it unless asked for
+    index = None
+    if args.index or reverse_index.index_ready():
+        index = reverse_index.open_index()
+    matches = lookup(targets, first_minute, end_minute, index)
+
+    found = np.unique(matches['seed']).size
+    print(f"{matches.size:,} clock settings for {found:,} of {targets.size:,} targets", file=sys.stderr)
+    stream = open(args.output, "wb") if args.output else sys.stdout.buffer
+    try:
+        for data in iter_format(matches, args.format):
+            stream.write(data)
+        stream.flush()
+    except BrokenPipeError:
+        sys.stderr.close()
+    finally:
+        if args.output:
+            stream.close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
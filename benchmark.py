@@ -0,0 +1,279 @@
+"""Seed throughput and table rendering benchmarks
+
+    python benchmark.py -o results.json
+    python benchmark.py -o new.json --compare results.json --threshold 0.2
+
+Seed results are reported as seeds/sec for the original per-row loop and the
+batched engine (in-process and across a shared-memory process pool, by worker
+count), and startup as the time from launching the GUI to its first painted
+frame and to the engine being loaded. Treeview and startup results need a
+display; when DISPLAY is unset and Xvfb is installed, a virtual display is
+started for them.
+"""
+import argparse
+from datetime import datetime, timedelta
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+import seed_engine
+
+SEED_SIZES = (10, 1000, 1000000, seed_engine.MINUTE_COUNT)
+TREE_SIZES = (1000, 10000)
+
+# The per-row loop takes minutes at century scale, so it is capped by default
+DEFAULT_MAX_PER_ROW = 1000000
+
+# Small cases are repeated until they've run this long, and the best run kept
+MIN_BENCH_SECONDS = 0.2
+
+
+def per_row_seeds(base_datetime, count):
+    # The loop delta_date.calculate_multiple_seeds used before seed_engine
+    seeds = []
+    datetimes = [base_datetime + timedelta(minutes=i) for i in range(count)]
+    for dt in datetimes:
+        reference_date = datetime(1999, 12, 31)
+        if dt.year > 2000:
+            days_difference = (dt - reference_date).days - 366
+        else:
+            days_difference = (dt - reference_date).days
+        h = int(dt.strftime("%H"), 16)
+        m = int(dt.strftime("%M"), 16)
+        total = (24 * 60 * days_difference) + (60 * h) + m
+        seeds.append((total >> 16) ^ (total & 0xFFFF))
+    return seeds
+
+
+def best_time(func):
+    best = None
+    spent = 0.0
+    while spent < MIN_BENCH_SECONDS or best is None:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        spent += elapsed
+    return best
+
+
+def bench_seeds(sizes, max_per_row):
+    results = {}
+    base_datetime = seed_engine.EPOCH
+    for size in sizes:
+        seconds = best_time(lambda: seed_engine.seeds_for_range(0, size))
+        results[f"seeds/engine/{size}"] = {'seconds': seconds, 'per_sec': size / seconds}
+        if size > max_per_row:
+            results[f"seeds/per_row/{size}"] = {'skipped': f"above --max-per-row {max_per_row}"}
+            continue
+        seconds = best_time(lambda: per_row_seeds(base_datetime, size))
+        results[f"seeds/per_row/{size}"] = {'seconds': seconds, 'per_sec': size / seconds}
+
+    # Both paths must agree, including across the year > 2000 boundary
+    check_start = datetime(2000, 12, 31, 12)
+    check_count = 2 * seed_engine.MINUTES_PER_DAY
+    engine = seed_engine.seeds_for_range(seed_engine.minute_index(check_start), check_count)
+    if not np.array_equal(engine, per_row_seeds(check_start, check_count)):
+        raise AssertionError("engine and per-row seeds disagree")
+    return results
+
+
+def bench_shared():
+    """Century of seeds through the shared-memory process pool, by worker count"""
+    import shared_seeds
+    results = {}
+    cpus = os.cpu_count() or 1
+    for workers in sorted({1, 2, 4, cpus}):
+        if workers > cpus:
+            continue
+
+        def run():
+            shared_seeds.generate(0, seed_engine.MINUTE_COUNT, workers).release()
+
+        seconds = best_time(run)
+        results[f"seeds/shared/{workers}_workers"] = {
+            'seconds': seconds, 'per_sec': seed_engine.MINUTE_COUNT / seconds}
+    return results
+
+
+# GUI launches timed; the best is kept
+STARTUP_RUNS = 5
+
+
+def bench_startup():
+    """Launch delta_date until its engine has loaded, then exit; needs a display
+
+    The times are the startup run's own phases, from its --trace record:
+    imports + window + first frame is the wait for the first painted frame,
+    and the run's total is the wait until the engine is ready too.
+    """
+    here = os.path.dirname(os.path.abspath(__file__))
+    first_frame = []
+    ready = []
+    with tempfile.TemporaryDirectory() as trace_dir:
+        for i in range(STARTUP_RUNS):
+            trace = os.path.join(trace_dir, f"startup-{i}.jsonl")
+            subprocess.run([sys.executable, 'delta_date.py', '--exit-after-startup', '--trace', trace],
+                           cwd=here, capture_output=True, check=True)
+            with open(trace) as f:
+                record = next(r for r in map(json.loads, f) if r['label'] == 'startup')
+            phases = record['phases']
+            first_frame.append(phases['imports'] + phases['window'] + phases['first frame'])
+            ready.append(record['total'])
+    return {
+        'startup/first_frame': {'seconds': min(first_frame), 'per_sec': 1 / min(first_frame)},
+        'startup/ready': {'seconds': min(ready), 'per_sec': 1 / min(ready)},
+    }
+
+
+def start_virtual_display():
+    """Start Xvfb if there is no display; returns the process or None"""
+    if os.environ.get('DISPLAY') or sys.platform == 'win32' or sys.platform == 'darwin':
+        return None
+    if not shutil.which('Xvfb'):
+        return None
+    display = ':99'
+    process = subprocess.Popen(['Xvfb', display, '-screen', '0', '1280x1024x24'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    time.sleep(0.5)
+    os.environ['DISPLAY'] = display
+    return process
+
+
+def bench_treeview(sizes):
+    import tkinter as tk
+    from tkinter import ttk
+    from virtual_table import VirtualTable
+
+    root = tk.Tk()
+    results = {}
+    try:
+        frame = tk.Frame(root)
+        frame.pack(fill="both", expand=True)
+        tree = ttk.Treeview(frame, columns=("Date", "Time", "Seed"), show="headings", height=20)
+        scrollbar = ttk.Scrollbar(frame, orient="vertical")
+        tree.pack(fill="both", expand=True)
+        root.update()
+        seeds = seed_engine.seeds_for_range(0, max(sizes))
+
+        for size in sizes:
+            def insert_all():
+                # One Treeview item per row, as delta_date did before VirtualTable
+                tree.delete(*tree.get_children())
+                for i in range(size):
+                    date, clock = seed_engine.format_minute(i)
+                    tree.insert("", "end", values=(date, clock, f"{seeds[i]:04X}"),
+                                tags=('evenrow' if i % 2 == 0 else 'oddrow',))
+                root.update_idletasks()
+            seconds = best_time(insert_all)
+            results[f"treeview/insert/{size}"] = {'seconds': seconds, 'per_sec': size / seconds}
+            tree.delete(*tree.get_children())
+
+            table = VirtualTable(tree, scrollbar, visible_rows=20)
+            def set_virtual():
+                table.set_source(size, lambda first, n: [
+                    seed_engine.format_minute(m) + (f"{seeds[m]:04X}",) for m in range(first, first + n)])
+                root.update_idletasks()
+            seconds = best_time(set_virtual)
+            results[f"treeview/virtual/{size}"] = {'seconds': seconds, 'per_sec': size / seconds}
+
+            def scroll_page():
+                table.scroll(table.visible_rows)
+                root.update_idletasks()
+            table.scroll_to(0)
+            seconds = best_time(scroll_page)
+            results[f"treeview/virtual_scroll/{size}"] = {'seconds': seconds, 'per_sec': 1 / seconds}
+            table.clear()
+    finally:
+        root.destroy()
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(current, baseline, threshold):
+    """List regressions: benchmarks whose per_sec dropped by more than threshold"""
+    regressions = []
+    for name, result in current['results'].items():
+        old = baseline['results'].get(name, {})
+        if 'per_sec' not in result or 'per_sec' not in old:
+            continue
+        change = result['per_sec'] / old['per_sec'] - 1
+        if change < -threshold:
+            regressions.append((name, old['per_sec'], result['per_sec'], change))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', '-o', help="write results as JSON")
+    parser.add_argument('--compare', help="baseline JSON from an earlier run")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="allowed throughput drop vs. the baseline (default 0.2 = 20%%)")
+    parser.add_argument('--max-per-row', type=int, default=DEFAULT_MAX_PER_ROW,
+                        help="largest size to time the per-row loop at")
+    parser.add_argument('--skip-treeview', action='store_true',
+                        help="skip the benchmarks that need a display (Treeview and GUI startup)")
+    args = parser.parse_args(argv)
+
+    results = bench_seeds(SEED_SIZES, args.max_per_row)
+    results.update(bench_shared())
+    if not args.skip_treeview:
+        xvfb = start_virtual_display()
+        try:
+            for name, bench in (('treeview', lambda: bench_treeview(TREE_SIZES)), ('startup', bench_startup)):
+                try:
+                    results.update(bench())
+                except Exception as e:
+                    # No display to draw on; the seed numbers are still useful
+                    results[name] = {'skipped': str(e)}
+        finally:
+            if xvfb is not None:
+                xvfb.terminate()
+
+    report = {
+        'meta': {
+            'commit': git_commit(),
+            'timestamp': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'numpy': np.__version__,
+            'platform': platform.platform(),
+            'cpus': os.cpu_count(),
+        },
+        'results': results,
+    }
+    for name, result in results.items():
+        if 'per_sec' in result:
+            print(f"{name:32} {result['seconds'] * 1000:12.3f} ms {result['per_sec']:16,.0f} /s")
+        else:
+            print(f"{name:32} skipped: {result['skipped']}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.threshold)
+        for name, old, new, change in regressions:
+            print(f"REGRESSION {name}: {old:,.0f}/s -> {new:,.0f}/s ({change:+.0%})")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,75 @@
+import re
+
+import numpy as np
+
+import seed_engine
+
+# Observations are written "SEED" or "SEED@N": a hex seed seen in-game, reset
+# N minutes after the entered clock time (N defaults to 0 and may be negative)
+OBSERVATION_PATTERN = re.compile(r"^([0-9A-Fa-f]{1,4})(?:@([+-]?\d+))?$")
+
+CANDIDATE_DTYPE = np.dtype([('offset', '<i8'), ('minute', '<i8'), ('matches', '<i4')])
+
+
+def parse_observations(text):
+    """List of (minutes after the entered time, seed) pairs"""
+    observations = []
+    for token in re.split(r"[\s,;]+", text.strip()):
+        if not token:
+            continue
+        match = OBSERVATION_PATTERN.match(token)
+        if not match:
+            raise ValueError(f"{token!r} is not SEED or SEED@MINUTES")
+        observations.append((int(match.group(2) or 0), int(match.group(1), 16)))
+    if not observations:
+        raise ValueError("enter at least one observed seed")
+    return observations
+
+
+def window_minutes(days=0, hours=0, minutes=0):
+    return days * seed_engine.MINUTES_PER_DAY + hours * 60 + minutes
+
+
+def solve(observations, base_minute, window):
+    """Rank clock offsets within +-window minutes by how many observations they explain
+
+    An offset d means the cartridge clock read base + d when the entered time
+    was base. The seeds for the whole neighbourhood are computed in one engine
+    call, so crossing the 2000/2001 day-counter change is handled like any
+    other day. Returns CANDIDATE_DTYPE rows with at least one match, best
+    first: most matches, then smallest |offset|.
+    """
+    if window < 0:
+        raise ValueError("window must not be negative")
+    times = np.array([time for time, _ in observations], dtype=np.int64)
+    seeds = np.array([seed for _, seed in observations], dtype=np.int64)
+
+    # Offsets that keep every observation inside the representable range
+    lowest = max(-window, -(base_minute + times.min()))
+    highest = min(window, seed_engine.MINUTE_COUNT - 1 - (base_minute + times.max()))
+    if lowest > highest:
+        return np.empty(0, dtype=CANDIDATE_DTYPE)
+    first = base_minute + times.min() + lowest
+    seeds_count = int(times.max() - times.min() + highest - lowest + 1)
+    neighbourhood = seed_engine.seeds_for_range(int(first), seeds_count)
+
+    # For observation i, offset d reads neighbourhood[times[i] - times.min() + d - lowest]
+    offsets = np.arange(lowest, highest + 1, dtype=np.int64)
+    matches = np.zeros(offsets.size, dtype=np.int32)
+    for time, seed in zip(times - times.min(), seeds):
+        matches += neighbourhood[time:time + offsets.size] == seed
+
+    found = np.flatnonzero(matches)
+    candidates = np.empty(found.size, dtype=CANDIDATE_DTYPE)
+    candidates['offset'] = offsets[found]
+    candidates['minute'] = base_minute + offsets[found]
+    candidates['matches'] = matches[found]
+    order = np.lexsort((np.abs(candidates['offset']), -candidates['matches']))
+    return candidates[order]
+
+
+def format_offset(offset):
+    """Signed offset as e.g. '+1d 02:03' or '-0d 00:05'"""
+    sign = '-' if offset < 0 else '+'
+    days, minutes = divmod(abs(int(offset)), seed_engine.MINUTES_PER_DAY)
+    return f"{sign}{days}d {minutes // 60:02d}:{minutes % 60:02d}"
@@ -1,10 +1,29 @@
+import time
+
+# Startup timing counts from here, before anything else is imported
+launch_time = time.perf_counter()
+
 from datetime import datetime, timedelta
 import tkinter as tk
-from tkinter import ttk
+from tkinter import filedialog, ttk
+import argparse
+import calendar
+import multiprocessing
 import os
+import shutil
 import sys
 import tempfile
 
+from background_job import BackgroundJob
+import timing
+from virtual_table import VirtualTable
+
+# NumPy and the modules built on it are imported by load_engine() once the
+# window is on screen; they're the bulk of the import time
+np = None
+analytics = batch_lookup = calibration = heatmap = lcrng = reverse_index = None
+rng_search = seed_engine = seed_export = seed_filter = shared_seeds = timer_plan = None
+
 # UI Color Variables
 main_background_color = '#5D4A8F'     # Main background
 button_color = '#7761AB'              # Color for button
@@ -45,17 +64,60 @@ def create_entry_with_placeholder(parent, row, col, default='0'):
     entry.bind('<FocusIn>', on_focus_in)
     entry.bind('<FocusOut>', on_focus_out)
     entry.grid(row=row, column=col, padx=2, pady=2)
+    entry.after(100, lambda: entry.config(bg='white'))
     return entry
 
+def make_button(parent, text, command, **options):
+    return tk.Button(
+        parent, 
+        text=text, 
+        command=command,
+        bg=button_color,
+        fg=button_text_color,
+        activebackground='#6E5BA8',
+        activeforeground=button_text_color,
+        relief='flat',
+        **options
+    )
+
+def make_tree(parent, columns, widths, height=None):
+    # Treeview with striped rows for a VirtualTable; widths is one width for
+    # every column or a {column: width} dict
+    options = {} if height is None else {'height': height}
+    tree = ttk.Treeview(parent, columns=columns, show="headings", style="Treeview", selectmode="browse", **options)
+    tree.tag_configure('oddrow', background='#f0f0f0')
+    tree.tag_configure('evenrow', background='#ffffff')
+    for column in columns:
+        tree.heading(column, text=column)
+        tree.column(column, width=widths if isinstance(widths, int) else widths[column], anchor="center")
+    return tree
+
+def make_table(window, columns, widths, visible_rows, on_select=None):
+    # Scrolling results area filling the rest of a window
+    table_frame = tk.Frame(window, padx=10, pady=10, bg=results_background)
+    table_frame.pack(fill="both", expand=True)
+    tree = make_tree(table_frame, columns, widths)
+    scrollbar = ttk.Scrollbar(table_frame, orient="vertical")
+    scrollbar.pack(side="right", fill="y")
+    tree.pack(fill="both", expand=True)
+    return VirtualTable(tree, scrollbar, visible_rows=visible_rows, row_height=25, on_select=on_select)
+
+def set_entry(entry, value):
+    # Replace an entry's text as if the user had typed it
+    entry.delete(0, tk.END)
+    entry.insert(0, str(value))
+    entry.config(**normal_style)
+
 def set_window_icon(root):
     """Handle icon setting for both development and compiled EXE"""
     try:
         if getattr(sys, 'frozen', False):
-            with open(os.path.join(sys._MEIPASS, "icon", "icon.ico"), "rb") as icon_file:
-                icon_data = icon_file.read()
+            bundled_icon = os.path.join(sys._MEIPASS, "icon", "icon.ico")
             temp_icon = os.path.join(tempfile.gettempdir(), "temp_icon.ico")
-            with open(temp_icon, "wb") as f:
-                f.write(icon_data)
+            # The copy from an earlier launch is reused; only a missing or
+            # different-sized one is rewritten
+            if not (os.path.exists(temp_icon) and os.path.getsize(temp_icon) == os.path.getsize(bundled_icon)):
+                shutil.copyfile(bundled_icon, temp_icon)
             root.iconbitmap(temp_icon)
         else:
             icon_path = os.path.join("icon", "icon.ico")
@@ -64,204 +126,1724 @@ def set_window_icon(root):
     except Exception as e:
         print(f"Couldn't set window icon: {e}")
 
-def calculate_multiple_seeds(event=None):
+# Rows stream into the table this many minutes at a time
+GENERATION_CHUNK = 1 << 18
+
+# Write buffer for exports
+EXPORT_BUFFER = 1 << 20
+
+# Seeds from recent queries, by absolute minute
+seed_cache = None
+
+# Past queries and their results, kept between launches
+sessions = None
+
+def load_engine():
+    global np, analytics, batch_lookup, calibration, heatmap, lcrng, reverse_index
+    global rng_search, seed_engine, seed_export, seed_filter, shared_seeds, timer_plan, seed_cache, sessions
+    import numpy as np
+    import analytics
+    import batch_lookup
+    import calibration
+    import heatmap
+    import lcrng
+    import reverse_index
+    import rng_search
+    import seed_engine
+    from seed_cache import SeedCache
+    import seed_export
+    import seed_filter
+    from session_store import SessionStore
+    import shared_seeds
+    import timer_plan
+    seed_cache = SeedCache()
+    try:
+        sessions = SessionStore()
+    except Exception as e:
+        # Carry on without history rather than not at all
+        print(f"Couldn't open the session store: {e}")
+
+def remember(kind, params, arrays, **index):
+    # Keep a query and its results for later launches
+    if sessions is not None:
+        sessions.save(kind, params, arrays, **index)
+
+def recall(kind, params):
+    # Results of an identical earlier query, or None
+    if sessions is None:
+        return None
+    query_id = sessions.find(kind, params)
+    if query_id is None:
+        return None
+    return sessions.load(query_id) or None
+
+# Running jobs by feature, newest last: 'generate' and 'sort' fill the
+# results on screen, the rest are 'reverse', 'batch', 'export', 'reach' and
+# 'search'. Each value is (BackgroundJob, on_cancel hook).
+jobs = {}
+
+# Jobs whose results replace the main table
+RESULT_JOBS = ('generate', 'sort', 'reverse', 'batch')
+
+def run_job(feature, work, on_chunk, run=None, on_done=None, on_cancel=None):
+    # One job per feature; starting one replaces that feature's old job
+    # without calling its on_cancel, which is only for an explicit cancel
+    stop_job(feature)
+    progress_bar['value'] = 0
+    cancel_button.config(state='normal')
+    
+    def on_progress(p):
+        # The bar follows the newest job
+        if next(reversed(jobs), None) == feature:
+            progress_bar['value'] = p
+    
+    def on_error(e):
+        result_table.show_message("Error:", str(e))
+        finish_job(feature, run)
+    
+    def finished():
+        finish_job(feature, run)
+        if on_done is not None:
+            on_done()
+    
+    job = BackgroundJob(
+        root, work,
+        on_chunk=on_chunk,
+        on_progress=on_progress,
+        on_done=finished,
+        on_error=on_error
+    )
+    jobs[feature] = (job, on_cancel)
+    job.start()
+
+def finish_job(feature, run=None):
+    if next(reversed(jobs), None) == feature:
+        progress_bar['value'] = 0
+    jobs.pop(feature, None)
+    # Shared blocks a finished job was still reading can be closed now
+    shared_seeds.close_released()
+    if not jobs:
+        cancel_button.config(state='disabled')
+    if run is not None:
+        run.finish()
+        timing_label.config(text=run.summary())
+
+def stop_job(feature):
+    # Abandon the feature's job, if any, and return its on_cancel hook
+    if feature not in jobs:
+        return None
+    job, on_cancel = jobs[feature]
+    job.cancel()
+    finish_job(feature)
+    return on_cancel
+
+def cancel_job(*features):
+    # The given features' jobs, or every job (the status bar's Cancel);
+    # each owner's on_cancel hook shows that it was cancelled
+    for feature in features or list(jobs):
+        on_cancel = stop_job(feature)
+        if on_cancel is not None:
+            on_cancel()
+
+def range_fields():
     # Dictionary of all entry fields and their validation ranges
-    entries = {
-        'year': {'widget': year_entry, 'min': 0, 'max': 9999},
+    return {
+        'year': {'widget': year_entry, 'min': seed_engine.FIRST_YEAR, 'max': seed_engine.LAST_YEAR},
         'month': {'widget': month_entry, 'min': 1, 'max': 12},
         'day': {'widget': day_entry, 'min': 1, 'max': 31},
         'hour': {'widget': hour_entry, 'min': 0, 'max': 23},
         'minute': {'widget': minute_entry, 'min': 0, 'max': 59},
-        'seeds': {'widget': seeds_entry, 'min': 1, 'max': 1000}
+        'seeds': {'widget': seeds_entry, 'min': 1, 'max': seed_engine.MINUTE_COUNT}
     }
+
+def check_field(field, config):
+    # Value of one range field; raises ValueError for bad input
+    entry = config['widget']
+    current_text = entry.get()
+    
+    # If field has placeholder styling but non-default value
+    if entry.cget('foreground') == placeholder_style['foreground'] and current_text != '0':
+        entry.config(foreground='black', font=('Helvetica', 10))  # Convert to real input
+    
+    value = int(entry.get())
+    if not (config['min'] <= value <= config['max']):
+        raise ValueError(f"{field} must be between {config['min']} and {config['max']}")
+    return value
+
+def clamped_datetime(values):
+    # Days past the end of the month fall back to its last day
+    last_day = calendar.monthrange(values['year'], values['month'])[1]
+    return datetime(values['year'], values['month'], min(values['day'], last_day),
+                    values['hour'], values['minute'])
+
+# Field values from the last successful read of the main inputs
+input_values = {}
+
+@timing.timed('parse')
+def read_range_inputs():
+    # Returns (start minute, count) for the entered range, or None after
+    # flagging the bad input
     
     # Auto-fill empty fields with defaults and validate
     values = {}
-    for field, config in entries.items():
+    for field, config in range_fields().items():
         entry = config['widget']
-        current_text = entry.get()
-        
-        # If field has placeholder styling but non-default value
-        if entry.cget('foreground') == placeholder_style['foreground'] and current_text != '0':
-            entry.config(foreground='black', font=('Helvetica', 10))  # Convert to real input
-        
-        # Get and validate value
         try:
-            value = int(entry.get())
-            if not (config['min'] <= value <= config['max']):
-                raise ValueError(f"{field} must be between {config['min']} and {config['max']}")
-            values[field] = value
+            values[field] = check_field(field, config)
         except ValueError as e:
             # Highlight invalid field
             entry.config(background='#ffdddd')
             entry.after(1000, lambda e=entry: e.config(background='white'))
-            result_tree.delete(*result_tree.get_children())  # Clear previous results
-            result_tree.insert("", "end", values=("Error:", str(e)))
+            result_table.show_message("Error:", str(e))  # Replace previous results
+            return None
+    
+    try:
+        # Handle invalid dates by using the last valid day of the month
+        base_datetime = clamped_datetime(values)
+        if base_datetime.day != values['day']:
+            values['day'] = base_datetime.day
+            day_entry.delete(0, tk.END)
+            day_entry.insert(0, str(base_datetime.day))
+            day_entry.config(foreground='black')
+        
+        count = values['seeds']
+        start = seed_engine.minute_index(base_datetime)
+        seed_engine.check_range(start, count)
+        input_values.clear()
+        input_values.update(values)
+        return start, count
+    
+    except Exception as e:
+        result_table.show_message("Error:", str(e))
+        return None
+
+def calculate_multiple_seeds(event=None):
+    cancel_job(*RESULT_JOBS)
+    stop_live_clock()
+    run = timing.start_run('generate')
+    inputs = read_range_inputs()
+    if inputs is None:
+        return
+    start, count = inputs
+    generate(start, count, run)
+
+def generate(start, count, run, reuse=None, store=True):
+    # Seeds are generated in the background and the table grows as
+    # chunks arrive; rows are only formatted once they scroll into view.
+    # `reuse` is an earlier generated view with the same start whose loaded
+    # seeds are copied rather than computed again. Only `store` runs (an
+    # explicit Generate, not typing) use the session store, so half-typed
+    # values never reach the history. Only the results' own jobs stop here;
+    # typing leaves searches, lookups and exports running.
+    cancel_job('generate', 'sort')
+    params = {'start': start, 'count': count}
+    if reuse is None and store:
+        # A range generated before is read back from the session store
+        with run.phase('load'):
+            stored = recall('range', params)
+        if stored is not None:
+            with run.phase('render'):
+                show_results(seed_filter.SeedView(stored['seeds'], start=start), run)
+            finish_job('generate', run)
+            return
+    
+    # Long ranges are written by a process pool straight into shared memory,
+    # which the table, filter and export then read in place
+    block = None
+    if shared_seeds.worth_parallel(count):
+        block = shared_seeds.SharedSeeds(start, count)
+        seeds = block.seeds
+    else:
+        seeds = np.empty(count, dtype=seed_engine.SEED_DTYPE)
+    loaded = 0
+    if reuse is not None:
+        loaded = min(reuse.count, count)
+        seeds[:loaded] = reuse.seeds[:loaded]
+    
+    # The first chunk is filled right away so the new window can be diffed
+    # against the rows already on screen; the rest streams in the background
+    first_chunk = max(loaded, min(count, GENERATION_CHUNK))
+    with run.phase('compute'):
+        seed_cache.get(start + loaded, first_chunk - loaded, out=seeds[loaded:first_chunk])
+    view = seed_filter.SeedView(seeds, start=start, count=first_chunk)
+    
+    def chunks():
+        # Minutes already in the cache from earlier queries aren't recomputed
+        for offset in range(first_chunk, count, GENERATION_CHUNK):
+            size = min(GENERATION_CHUNK, count - offset)
+            yield offset, seed_cache.get(start + offset, size)
+    
+    def work():
+        if block is not None:
+            # Workers finish out of order; only the complete front is shown
+            yield from run.iter_phase('compute', shared_seeds.iter_fill(block, first_chunk))
+            return
+        for offset, chunk in run.iter_phase('compute', chunks()):
+            yield (offset + chunk.size) / count, (offset, chunk)
+    
+    def on_chunk(chunk):
+        with run.phase('render'):
+            if block is not None:
+                loaded = chunk
+            else:
+                offset, part = chunk
+                seeds[offset:offset + part.size] = part
+                loaded = offset + part.size
+            view.set_count(loaded)
+            # A filtered or sorted view is refreshed once everything is in
+            if not filter_active():
+                result_table.set_count(loaded)
+    
+    def on_done():
+        if store:
+            remember('range', params, {'seeds': seeds}, first_minute=start, end_minute=start + count)
+        if filter_active():
+            apply_filter()
+    
+    with run.phase('render'):
+        show_results(view, run, block)
+    run_job('generate', work, on_chunk, run, on_done=on_done)
+
+# Typing in the main inputs regenerates the table after this pause
+RECOMPUTE_DEBOUNCE_MS = 150
+
+recompute_state = {'after_id': None, 'fields': set()}
+
+def schedule_recompute(field):
+    def on_key(event):
+        if event.keysym in ('Return', 'KP_Enter', 'Tab', 'ISO_Left_Tab'):
             return
+        recompute_state['fields'].add(field)
+        if recompute_state['after_id'] is not None:
+            root.after_cancel(recompute_state['after_id'])
+        recompute_state['after_id'] = root.after(RECOMPUTE_DEBOUNCE_MS, recompute)
+    return on_key
+
+def recompute():
+    # Only the fields typed in since the last read are validated; the others
+    # keep their last good values
+    fields = recompute_state['fields']
+    recompute_state['after_id'] = None
+    recompute_state['fields'] = set()
+    if live_state is not None:
+        return
+    run = timing.start_run('recompute')
+    if not input_values:
+        # Nothing generated yet; start from a full read
+        inputs = read_range_inputs()
+        if inputs is not None:
+            generate(*inputs, run, store=False)
+        return
+    
+    values = dict(input_values)
+    rules = range_fields()
+    with run.phase('parse'):
+        for field in fields:
+            entry = rules[field]['widget']
+            try:
+                values[field] = check_field(field, rules[field])
+            except ValueError:
+                # Stays marked until the field holds a valid value again
+                entry.config(background='#ffdddd')
+                return
+            entry.config(background='white')
+        try:
+            start = seed_engine.minute_index(clamped_datetime(values))
+            count = values['seeds']
+            seed_engine.check_range(start, count)
+        except ValueError as e:
+            timing_label.config(text=f"Error: {e}")
+            return
+    if values == input_values:
+        return
+    input_values.clear()
+    input_values.update(values)
+    
+    view = result_view
+    if view is not None and view.in_minute_order and view.start == start:
+        # Only the length changed: keep every seed already loaded, compute
+        # just the extra rows, and let the keyed table leave the rest alone
+        generate(start, count, run, reuse=view, store=False)
+    else:
+        # Moved in time: the seed cache and the keyed table diff reuse
+        # whatever overlaps the previous window
+        generate(start, count, run, store=False)
+
+def export_seeds():
+    # Write the entered range straight from the seed engine, chunk by chunk
+    run = timing.start_run('export')
+    inputs = read_range_inputs()
+    if inputs is None:
+        return
+    start, count = inputs
+    path = filedialog.asksaveasfilename(
+        parent=root,
+        title="Export Seeds",
+        defaultextension=".csv",
+        filetypes=[("CSV", "*.csv"), ("JSON Lines", "*.jsonl"), ("Packed uint16", "*.bin")]
+    )
+    if not path:
+        return
+    fmt = os.path.splitext(path)[1].lstrip('.').lower()
+    if fmt not in seed_export.FORMATS:
+        fmt = 'csv'
+    # Rows already generated are written from the results without recomputing
+    source = results_source(start, count) or seed_engine.seeds_for_range
+    
+    def work():
+        finished = False
+        f = open(path, "wb", buffering=EXPORT_BUFFER)
+        try:
+            chunks = seed_export.iter_export_chunks(start, count, fmt, source=source)
+            for done, data in run.iter_phase('compute', chunks):
+                with run.phase('write'):
+                    f.write(data)
+                yield done / count, None
+            finished = True
+        finally:
+            f.close()
+            # Don't leave a truncated export behind if the job was abandoned
+            if not finished:
+                os.remove(path)
+        yield 1.0, f"Exported {count:,} seeds to {os.path.basename(path)}"
+    
+    run_job('export', work, lambda message: result_table.show_message("Export:", message), run,
+            on_cancel=lambda: result_table.show_message("Export:", f"Cancelled; {os.path.basename(path)} removed"))
+
+def format_rows(minutes, seeds):
+    rows = []
+    for minute, seed in zip(minutes, seeds):
+        date, time = seed_engine.format_minute(minute)
+        rows.append((date, time, f"{seed:04X}"))
+    return rows
+
+# Filter bar: the last result set, filtered and/or sorted by seed
+FILTER_DEBOUNCE_MS = 200
+
+# Results up to this size are filtered on the UI thread; a bigger one has its
+# seed order built in the background first
+FILTER_SYNC_ROWS = 1 << 21
+
+result_view = None
+
+# Shared-memory block behind result_view when the process pool generated it
+result_block = None
+
+filter_after_id = None
+
+def filter_active():
+    return bool(filter_entry.get().strip()) or sort_var.get()
+
+def show_results(view, run=None, block=None):
+    # New results go through the filter bar when it is in use
+    global result_view, result_block
+    result_view = view
+    if view is None:
+        filter_status.config(text="")
+    elif filter_active():
+        apply_filter(run)
+    else:
+        show_view(view, None, False)
+    # The last block is released once it is off screen; a job still reading
+    # from it keeps its mapping until the job lets go
+    if result_block is not None and result_block is not block:
+        result_block.release()
+    result_block = block
+
+def results_source(start, count):
+    # Seed source reading the current results in place when they already
+    # hold the whole range, else None
+    view = result_view
+    if view is None or not view.in_minute_order:
+        return None
+    if not (view.start <= start and start + count <= view.start + view.count):
+        return None
+    return lambda first, n: view.seeds[first - view.start:first - view.start + n]
+
+def show_view(view, rows, by_seed):
+    if rows is None:
+        count = view.count
+        fetch = lambda first, n: format_rows(view.minutes_for(np.arange(first, first + n)), view.seeds[first:first + n])
+        filter_status.config(text="")
+    else:
+        count = rows.size
+        fetch = lambda first, n: format_rows(view.minutes_for(rows[first:first + n]), view.seeds[rows[first:first + n]])
+        filter_status.config(text=f"{count:,} of {view.count:,} rows")
+    # Rows are keyed by minute while they are in minute order, so rows still
+    # on screen from the last query or filter stay put
+    key = None
+    if view.in_minute_order and not by_seed:
+        key = (lambda row: view.start + row) if rows is None else (lambda row: view.start + int(rows[row]))
+    result_table.set_source(count, fetch, key=key)
+
+def schedule_filter(event=None):
+    # Wait for a pause in typing before filtering
+    global filter_after_id
+    if filter_after_id is not None:
+        root.after_cancel(filter_after_id)
+    filter_after_id = root.after(FILTER_DEBOUNCE_MS, apply_filter)
+
+def apply_filter(run=None):
+    global filter_after_id
+    if filter_after_id is not None:
+        root.after_cancel(filter_after_id)
+        filter_after_id = None
+    view = result_view
+    if view is None:
+        return "break"
+    try:
+        ranges = seed_filter.parse_filter(filter_entry.get())
+    except ValueError as e:
+        filter_entry.config(background='#ffdddd')
+        filter_status.config(text=str(e))
+        return "break"
+    filter_entry.config(background='white')
+    by_seed = sort_var.get()
     
+    if (ranges is not None or by_seed) and view.order is None and view.count > FILTER_SYNC_ROWS:
+        if 'generate' in jobs:
+            filter_status.config(text="Filter applies when generation finishes")
+            return "break"
+        sort_run = timing.start_run('sort')
+        
+        def work():
+            with sort_run.phase('sort'):
+                view.prepare()
+            yield 1.0, view
+        
+        filter_status.config(text="Sorting...")
+        run_job('sort', work, lambda done: done is result_view and apply_filter(), sort_run,
+                on_cancel=lambda: filter_status.config(text="Sort cancelled"))
+        return "break"
+    
+    own_run = run is None
+    if own_run:
+        run = timing.start_run('filter')
+    with run.phase('filter'):
+        rows = view.select(ranges, by_seed)
+    with run.phase('render'):
+        show_view(view, rows, by_seed)
+    if own_run:
+        run.finish()
+        timing_label.config(text=run.summary())
+    return "break"
+
+# Live clock: the table follows the cartridge clock, one row per minute
+LIVE_LOOKAHEAD = 1440
+
+live_state = None
+
+def start_live_clock():
+    global live_state
+    cancel_job(*RESULT_JOBS)
+    stop_live_clock()
+    run = timing.start_run('live')
+    inputs = read_range_inputs()
+    if inputs is None:
+        return
+    start, count = inputs
+    try:
+        offset = read_fields({'offset': (offset_entry, -1000000, 1000000)})['offset'] or 0
+    except ValueError as e:
+        result_table.show_message("Error:", str(e))
+        return
+    
+    # The filter bar doesn't apply to the moving window
+    show_results(None)
+    
+    # The entered time is "now" on the cartridge, nudged by the offset
+    entered = seed_engine.minute_datetime(start)
+    live_state = {
+        'delta': entered - datetime.now() + timedelta(minutes=offset),
+        'count': count,
+        'buffer_start': 0,
+        'seeds': np.empty(0, dtype=seed_engine.SEED_DTYPE),
+        'after_id': None,
+    }
+    live_button.config(text="Stop Live Clock")
+    with run.phase('render'):
+        live_tick()
+    run.finish()
+    timing_label.config(text=run.summary())
+
+def stop_live_clock():
+    global live_state
+    if live_state is None:
+        return
+    if live_state['after_id'] is not None:
+        root.after_cancel(live_state['after_id'])
+    live_state = None
+    result_table.set_highlight(None)
+    live_button.config(text="Start Live Clock")
+
+def toggle_live_clock():
+    if live_state is None:
+        start_live_clock()
+    else:
+        stop_live_clock()
+
+def fill_live_buffer(current):
+    # Seeds for the window plus the next LIVE_LOOKAHEAD minutes in one batch,
+    # so a tick only slices seeds that are already computed. Rows are
+    # formatted as the table shows them, like show_view does.
+    size = min(live_state['count'] + LIVE_LOOKAHEAD, seed_engine.MINUTE_COUNT - current)
+    live_state['buffer_start'] = current
+    live_state['seeds'] = seed_cache.get(current, size)
+
+def live_tick():
+    now = datetime.now() + live_state['delta']
     try:
-        # Clear previous results and errors
-        result_tree.delete(*result_tree.get_children())
+        current = seed_engine.minute_index(now.replace(second=0, microsecond=0))
+    except ValueError as e:
+        stop_live_clock()
+        result_table.show_message("Error:", str(e))
+        return
+    
+    count = min(live_state['count'], seed_engine.MINUTE_COUNT - current)
+    offset = current - live_state['buffer_start']
+    if offset < 0 or offset + count > live_state['seeds'].size:
+        fill_live_buffer(current)
+        offset = 0
+    seeds = live_state['seeds']
+    
+    # Same keys as the previous tick, shifted by one: the table drops the
+    # oldest row, appends one, and moves the highlight
+    result_table.set_source(count, lambda first, n: format_rows(range(current + first, current + first + n),
+                                                                seeds[offset + first:offset + first + n]),
+                            key=lambda row: current + row)
+    result_table.set_highlight(current)
+    
+    # Wake up just after the next cartridge minute starts
+    seconds = now.second + now.microsecond / 1000000
+    live_state['after_id'] = root.after(int((60 - seconds) * 1000) + 5, live_tick)
+
+def iter_index_build():
+    # The reverse index is built once, on the first lookup that needs it
+    if not reverse_index.index_ready():
+        for progress in reverse_index.iter_build_index():
+            yield progress, None
+
+def find_times_for_seed(event=None):
+    # Reverse lookup: every clock setting that produces the entered seed
+    cancel_job(*RESULT_JOBS)
+    stop_live_clock()
+    run = timing.start_run('reverse')
+    try:
+        with run.phase('parse'):
+            seed = int(seed_entry.get(), 16)
+        if not (0 <= seed < seed_engine.SEED_SPACE):
+            raise ValueError("seed must be between 0000 and FFFF")
+    except ValueError as e:
+        seed_entry.config(background='#ffdddd')
+        seed_entry.after(1000, lambda: seed_entry.config(background='white'))
+        result_table.show_message("Error:", str(e))
+        return "break"
+    
+    def work():
+        with run.phase('load'):
+            stored = recall('reverse', {'seed': seed})
+        if stored is not None:
+            yield 1.0, stored['minutes']
+            return
+        yield from run.iter_phase('index', iter_index_build())
+        with run.phase('compute'):
+            minutes = reverse_index.open_index().minutes_for_seed(seed)
+        remember('reverse', {'seed': seed}, {'minutes': minutes}, seeds=[seed])
+        yield 1.0, minutes
+    
+    def on_chunk(minutes):
+        with run.phase('render'):
+            show_results(seed_filter.SeedView(np.full(len(minutes), seed, dtype=seed_engine.SEED_DTYPE), minutes=minutes), run)
+    
+    result_table.clear()
+    run_job('reverse', work, on_chunk, run, on_cancel=lambda: result_table.show_message("Cancelled"))
+    
+    # Keep the root <Return> binding from regenerating the forward list
+    return "break"
         
-        # Create base datetime with proper validation
+def run_batch_lookup():
+    # Every clock setting for a whole file of target seeds, grouped by seed
+    cancel_job(*RESULT_JOBS)
+    stop_live_clock()
+    try:
+        first_minute, end_minute = read_year_range()
+    except ValueError as e:
+        result_table.show_message("Error:", str(e))
+        return
+    path = filedialog.askopenfilename(
+        parent=root,
+        title="Target Seeds",
+        filetypes=[("Text", "*.txt *.csv"), ("All files", "*")]
+    )
+    if not path:
+        return
+    run = timing.start_run('batch')
+    try:
+        with run.phase('parse'):
+            targets = batch_lookup.read_targets(path)
+    except (OSError, ValueError) as e:
+        result_table.show_message("Error:", str(e))
+        return
+    
+    def work():
+        # Use the reverse index if it has already been built, otherwise a
+        # single sweep of the range is faster than building it
+        index = reverse_index.open_index() if reverse_index.index_ready() else None
+        parts = []
+        for progress, part in run.iter_phase('compute', batch_lookup.iter_lookup(targets, first_minute, end_minute, index)):
+            parts.append(part)
+            yield progress, None
+        with run.phase('sort'):
+            matches = batch_lookup.collect(parts)
+        yield 1.0, matches
+    
+    def on_chunk(matches):
+        if not matches.size:
+            result_table.show_message("No matches")
+            return
+        with run.phase('render'):
+            show_results(seed_filter.SeedView(matches['seed'], minutes=matches['minute']), run)
+    
+    result_table.show_message("Searching...")
+    run_job('batch', work, on_chunk, run, on_cancel=lambda: result_table.show_message("Cancelled"))
+
+def read_year_range():
+    # The From/To Year inputs as (first minute, end minute)
+    values = read_fields({'from year': (batch_first_entry, seed_engine.FIRST_YEAR, seed_engine.LAST_YEAR),
+                          'to year': (batch_last_entry, seed_engine.FIRST_YEAR, seed_engine.LAST_YEAR)})
+    return seed_engine.year_range(values['from year'] or seed_engine.FIRST_YEAR,
+                                  values['to year'] or seed_engine.LAST_YEAR)
+
+reachability_stats = None
+
+def run_reachability():
+    # How many clock settings reach each seed over the From/To years;
+    # repeat ranges come straight from the disk cache
+    try:
+        first_minute, end_minute = read_year_range()
+    except ValueError as e:
+        reach_label.config(text=f"Error: {e}")
+        return
+    run = timing.start_run('reachability')
+    
+    source = results_source(first_minute, end_minute - first_minute) or seed_engine.seeds_for_range
+    
+    def work():
+        yield from run.iter_phase('compute', analytics.iter_reachability(first_minute, end_minute, source=source))
+    
+    def on_chunk(stats):
+        with run.phase('render'):
+            show_reachability(stats)
+    
+    reach_label.config(text="Counting...")
+    run_job('reach', work, on_chunk, run, on_cancel=lambda: reach_label.config(text="Cancelled"))
+
+def show_reachability(stats=None):
+    global reachability_stats
+    if stats is not None:
+        reachability_stats = stats
+    stats = reachability_stats
+    if stats is None:
+        return
+    reached = stats['count'] > 0
+    reachable = int(np.count_nonzero(reached))
+    lines = [f"{reachable:,} of {seed_engine.SEED_SPACE:,} seeds reachable"]
+    if reachable:
+        counts = stats['count'][reached]
+        lines.append(f"{int(counts.min()):,}-{int(counts.max()):,} settings per seed")
+        lines.append("earliest {} {}".format(*seed_engine.format_minute(stats['earliest'][reached].min())))
+        lines.append("latest {} {}".format(*seed_engine.format_minute(stats['latest'][reached].max())))
+    reach_label.config(text="\n".join(lines))
+    
+    shown = analytics.unreachable_seeds(stats) if unreachable_var.get() else np.arange(seed_engine.SEED_SPACE)
+    
+    def fetch(first, n):
+        rows = []
+        for seed in shown[first:first + n].tolist():
+            count, earliest, latest = stats[seed].tolist()
+            rows.append((f"{seed:04X}", count,
+                         " ".join(seed_engine.format_minute(earliest)) if earliest >= 0 else "-",
+                         " ".join(seed_engine.format_minute(latest)) if latest >= 0 else "-"))
+        return rows
+    
+    if shown.size:
+        reach_table.set_source(shown.size, fetch)
+    else:
+        reach_table.show_message("None")
+
+def use_reach_seed(row):
+    # Selecting a seed readies it for Find Times for Seed
+    values = reach_table.selected_values()
+    if values and len(values) == 4:
+        set_entry(seed_entry, values[0])
+
+def format_frames(seed, first, count):
+    # Jump straight to the first visible frame, then step through the rest
+    rows = []
+    state = lcrng.jump(seed, first)
+    for frame in range(first, first + count):
+        rows.append((frame, f"{state:08X}", f"{lcrng.rand(state):04X}"))
+        state = lcrng.next_state(state)
+    return rows
+
+def show_frames(row=None):
+    # The frames panel follows whichever seed row is selected
+    values = result_table.selected_values()
+    try:
+        seed = int(values[2], 16)
+    except (TypeError, IndexError, ValueError):
+        frames_table.clear()
+        frames_label.config(text="Frames: select a seed")
+        return
+    frames_label.config(text=f"Frames for seed {seed:04X}")
+    frames_table.set_source(lcrng.PERIOD, lambda first, n: format_frames(seed, first, n), top=frames_table.top)
+
+def jump_to_frame(event=None):
+    try:
+        frame = int(frame_entry.get())
+        if not (0 <= frame < lcrng.PERIOD):
+            raise ValueError
+    except ValueError:
+        frame_entry.config(background='#ffdddd')
+        frame_entry.after(1000, lambda: frame_entry.config(background='white'))
+        return "break"
+    frames_table.scroll_to(frame)
+    return "break"
+
+def read_fields(fields):
+    # Validate {name: (entry, min, max)} like the main inputs; blank entries give None
+    values = {}
+    for field, (entry, minimum, maximum) in fields.items():
+        text = entry.get().strip()
+        if not text:
+            values[field] = None
+            continue
         try:
-            base_datetime = datetime(
-                values['year'],
-                values['month'],
-                values['day'],
-                values['hour'],
-                values['minute']
-            )
+            value = int(text)
         except ValueError:
-            # Handle invalid dates by using the last valid day of the month
-            import calendar
-            last_day = calendar.monthrange(values['year'], values['month'])[1]
-            base_datetime = datetime(
-                values['year'],
-                values['month'],
-                min(values['day'], last_day),
-                values['hour'],
-                values['minute']
+            value = None
+        if value is None or not (minimum <= value <= maximum):
+            entry.config(background='#ffdddd')
+            entry.after(1000, lambda e=entry: e.config(background='white'))
+            raise ValueError(f"{field} must be between {minimum} and {maximum}")
+        values[field] = value
+    return values
+
+def format_search_rows(hits, minutes, hit_rows, press_ms, first, count):
+    rows = []
+    for minute, row, ms in zip(minutes[first:first + count], hit_rows[first:first + count], press_ms[first:first + count]):
+        hit = hits[row]
+        date, time = seed_engine.format_minute(minute)
+        ivs = rng_search.ivs(hit['iv1'], hit['iv2'])
+        rows.append((
+            date, time, f"{hit['seed']:04X}", int(hit['frame']),
+            timer_plan.format_ms(ms),
+            rng_search.NATURES[hit['pid'] % 25],
+            "/".join(str(ivs[stat]) for stat in rng_search.STATS),
+            f"{hit['pid']:08X}"
+        ))
+    return rows
+
+target_search_window = None
+
+def open_target_search(params=None):
+    # Search every initial seed for a Method 1 spread, then list the clock
+    # settings that reach it, fewest frames first. `params` reopens a stored
+    # search from the history.
+    global target_search_window
+    if target_search_window is not None and target_search_window.winfo_exists():
+        if params is None:
+            target_search_window.lift()
+            return
+        stop_job('search')
+        target_search_window.destroy()
+    window = target_search_window = tk.Toplevel(root)
+    window.title("Target Search")
+    window.configure(bg=main_background_color)
+    
+    form = tk.Frame(window, padx=10, pady=10, bg=main_background_color)
+    form.pack()
+    
+    tk.Label(form, text="Min", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=1)
+    tk.Label(form, text="Max", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=2)
+    iv_entries = {}
+    for i, stat in enumerate(rng_search.STATS, 1):
+        tk.Label(form, text=f"{stat}:", bg=main_background_color, fg=input_field_text_color).grid(row=i, column=0, sticky="e")
+        iv_entries[stat] = (create_entry_with_placeholder(form, i, 1, '0'), create_entry_with_placeholder(form, i, 2, '31'))
+    
+    tk.Label(form, text="Nature:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=3, sticky="e")
+    nature_box = ttk.Combobox(form, values=["Any"] + rng_search.NATURES, state="readonly", width=10)
+    nature_box.current(0)
+    nature_box.grid(row=0, column=4, columnspan=2, sticky="w", padx=2, pady=2)
+    
+    tk.Label(form, text="Frames:", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=3, sticky="e")
+    min_frame_entry = create_entry_with_placeholder(form, 1, 4, '0')
+    max_frame_entry = create_entry_with_placeholder(form, 1, 5, '1000')
+    
+    tk.Label(form, text="Years:", bg=main_background_color, fg=input_field_text_color).grid(row=2, column=3, sticky="e")
+    first_year_entry = create_entry_with_placeholder(form, 2, 4, "2000")
+    last_year_entry = create_entry_with_placeholder(form, 2, 5, "2099")
+    
+    # Leave TID/SID blank to skip the shiny check
+    tk.Label(form, text="TID / SID:", bg=main_background_color, fg=input_field_text_color).grid(row=3, column=3, sticky="e")
+    tid_entry = tk.Entry(form, width=5)
+    tid_entry.grid(row=3, column=4, padx=2, pady=2)
+    sid_entry = tk.Entry(form, width=5)
+    sid_entry.grid(row=3, column=5, padx=2, pady=2)
+    
+    # "Press A" is the time from the reset to the press that lands on the frame
+    search_columns = ("Date", "Time", "Seed", "Frame", "Press A", "Nature", "IVs", "PID")
+    
+    def plan_search_row(row):
+        # Selecting a result opens the timer for its clock setting and frame
+        values = search_table.selected_values()
+        if values and len(values) == len(search_columns):
+            open_timer(values[:3], values[3])
+    
+    search_table = make_table(window, search_columns, {column: 130 if column == "IVs" else 80 for column in search_columns},
+                              visible_rows=15, on_select=plan_search_row)
+    
+    def run_search(event=None):
+        fields = {'min frame': (min_frame_entry, 0, lcrng.PERIOD - 1),
+                  'max frame': (max_frame_entry, 0, lcrng.PERIOD - 1),
+                  'first year': (first_year_entry, seed_engine.FIRST_YEAR, seed_engine.LAST_YEAR),
+                  'last year': (last_year_entry, seed_engine.FIRST_YEAR, seed_engine.LAST_YEAR),
+                  'TID': (tid_entry, 0, 0xFFFF),
+                  'SID': (sid_entry, 0, 0xFFFF)}
+        for stat, (min_entry, max_entry) in iv_entries.items():
+            fields[f"{stat} min"] = (min_entry, 0, 31)
+            fields[f"{stat} max"] = (max_entry, 0, 31)
+        try:
+            values = read_fields(fields)
+            nature = nature_box.get()
+            criteria = rng_search.make_criteria(
+                values['max frame'] if values['max frame'] is not None else 1000,
+                iv_min={stat: values[f"{stat} min"] or 0 for stat in rng_search.STATS},
+                iv_max={stat: 31 if values[f"{stat} max"] is None else values[f"{stat} max"] for stat in rng_search.STATS},
+                natures=None if nature == "Any" else [nature],
+                tid=values['TID'],
+                sid=values['SID'],
+                min_frame=values['min frame'] or 0
             )
-            day_entry.delete(0, tk.END)
-            day_entry.insert(0, str(last_day))
-            day_entry.config(foreground='black')
+            first_minute, last_minute = seed_engine.year_range(values['first year'] or seed_engine.FIRST_YEAR,
+                                                               values['last year'] or seed_engine.LAST_YEAR)
+        except ValueError as e:
+            search_table.show_message("Error:", str(e))
+            return "break"
         
-        # Generate requested number of consecutive minutes
-        num_seeds = values['seeds']
-        datetimes = [base_datetime + timedelta(minutes=i) for i in range(num_seeds)]
+        run = timing.start_run('search')
+        params = {'criteria': criteria, 'years': [values['first year'], values['last year']],
+                  'tid': values['TID'], 'sid': values['SID'], 'limit': rng_search.MAX_HITS}
         
-        # Calculate and display seeds
-        for i, dt in enumerate(datetimes):
-            reference_date = datetime(1999, 12, 31)
-            if dt.year > 2000:
-                days_difference = (dt - reference_date).days - 366
+        def work():
+            # The same search run before is read back instead of repeated
+            with run.phase('load'):
+                stored = recall('target', params)
+            if stored is not None:
+                yield 1.0, (stored['hits'], stored['minutes'], stored['hit_rows'])
+                return
+            yield from run.iter_phase('index', iter_index_build())
+            hits = rng_search.first_hits([])
+            for progress, chunk in run.iter_phase('compute', rng_search.iter_search(criteria)):
+                # Merge as tasks finish, keeping only the first MAX_HITS
+                hits = rng_search.first_hits([hits, chunk])
+                yield progress, None
+            with run.phase('rank'):
+                minutes, hit_rows = rng_search.rank_clock_settings(hits, reverse_index.open_index(), first_minute, last_minute)
+            remember('target', params,
+                     {'hits': hits, 'minutes': minutes.astype('<u4'), 'hit_rows': hit_rows.astype('<u4')},
+                     first_minute=first_minute, end_minute=last_minute, seeds=hits['seed'], row_count=minutes.size)
+            yield 1.0, (hits, minutes, hit_rows)
+        
+        def on_chunk(result):
+            hits, minutes, hit_rows = result
+            if len(hits) >= rng_search.MAX_HITS:
+                limit_label.config(text=f"First {rng_search.MAX_HITS:,} hits by frame; narrow the search for the rest")
             else:
-                days_difference = (dt - reference_date).days
-            
-            # Convert hours/minutes to hexadecimal values (this is key)
-            h = int(dt.strftime("%H"), 16)
-            m = int(dt.strftime("%M"), 16)
-            
-            # Calculate total minutes and seed
-            total = (24 * 60 * days_difference) + (60 * h) + m
-            seed = (total >> 16) ^ (total & 0xFFFF)
-            
-            # Alternate row colors
-            tag = 'evenrow' if i % 2 == 0 else 'oddrow'
-            result_tree.insert("", "end", 
-                            values=(dt.strftime("%H:%M"), f"{seed:04X}"), 
-                            tags=(tag,))
+                limit_label.config(text="")
+            if not len(minutes):
+                search_table.show_message("No matches")
+                return
+            with run.phase('render'):
+                # Every row's press time in one vectorized plan
+                press_ms = timer_plan.plan(hits['frame'][hit_rows])['target_ms']
+                search_table.set_source(len(minutes), lambda first, n: format_search_rows(hits, minutes, hit_rows, press_ms, first, n))
+        
+        search_table.show_message("Searching...")
+        run_job('search', work, on_chunk, run, on_cancel=lambda: search_table.show_message("Cancelled"))
+        return "break"
     
-    except Exception as e:
-        result_tree.insert("", "end", values=("Error:", str(e)))
+    search_button = make_button(form, "Search", run_search)
+    search_button.grid(row=5, column=3, columnspan=3, pady=5)
+    limit_label = tk.Label(form, text="", bg=main_background_color, fg=input_field_text_color)
+    limit_label.grid(row=7, column=0, columnspan=6)
+    window.bind('<Return>', run_search)
+    window.bind('<KP_Enter>', run_search)
+    
+    def close():
+        # A search still running has no table left to fill
+        stop_job('search')
+        window.destroy()
+    
+    window.protocol("WM_DELETE_WINDOW", close)
+    
+    if params is not None:
+        criteria = params['criteria']
+        for stat, (min_entry, max_entry) in iv_entries.items():
+            set_entry(min_entry, criteria['iv_min'][stat])
+            set_entry(max_entry, criteria['iv_max'][stat])
+        set_entry(min_frame_entry, criteria['min_frame'])
+        set_entry(max_frame_entry, criteria['max_frame'])
+        for entry, value in zip((first_year_entry, last_year_entry, tid_entry, sid_entry),
+                                (*params['years'], params['tid'], params['sid'])):
+            if value is not None:
+                set_entry(entry, value)
+        if criteria['natures']:
+            nature_box.set(rng_search.NATURES[criteria['natures'][0]])
+        run_search()
+
+calibration_window = None
+
+def open_calibration():
+    # Work out how far the cartridge clock is from the entered date/time,
+    # given seeds actually hit in-game
+    global calibration_window
+    if calibration_window is not None and calibration_window.winfo_exists():
+        calibration_window.lift()
+        return
+    window = calibration_window = tk.Toplevel(root)
+    window.title("Clock Calibration")
+    window.configure(bg=main_background_color)
+    
+    form = tk.Frame(window, padx=10, pady=10, bg=main_background_color)
+    form.pack()
+    
+    # SEED for a reset at the entered time, SEED@N for one N minutes later
+    tk.Label(form, text="Observed (SEED or SEED@min):", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=0, sticky="e")
+    observed_entry = tk.Entry(form, width=30)
+    observed_entry.grid(row=0, column=1, columnspan=5, sticky="w", padx=2, pady=2)
+    
+    tk.Label(form, text="± Days:", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=0, sticky="e")
+    days_entry = create_entry_with_placeholder(form, 1, 1, '7')
+    tk.Label(form, text="± Hours:", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=2, sticky="e")
+    hours_entry = create_entry_with_placeholder(form, 1, 3, '0')
+    tk.Label(form, text="± Minutes:", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=4, sticky="e")
+    minutes_entry = create_entry_with_placeholder(form, 1, 5, '0')
+    
+    summary_label = tk.Label(form, text="Uses the date/time entered in the main window", bg=main_background_color, fg=input_field_text_color)
+    summary_label.grid(row=3, column=0, columnspan=6, sticky="w")
+    
+    candidates = np.empty(0, dtype=calibration.CANDIDATE_DTYPE)
+    observations = []
+    
+    def use_offset(row):
+        # The chosen offset carries over to the live clock
+        if row < candidates.size:
+            set_entry(offset_entry, int(candidates[row]['offset']))
+    
+    calibration_table = make_table(window, ("Offset", "Date", "Time", "Matches"), 100, visible_rows=10, on_select=use_offset)
+    
+    def format_candidates(first, count):
+        rows = []
+        for candidate in candidates[first:first + count]:
+            date, time = seed_engine.format_minute(candidate['minute'])
+            rows.append((calibration.format_offset(candidate['offset']), date, time,
+                         f"{candidate['matches']}/{len(observations)}"))
+        return rows
+    
+    def solve(event=None):
+        nonlocal candidates, observations
+        # Started first so reading the inputs is timed as this run's parse
+        run = timing.start_run('calibrate')
+        inputs = read_range_inputs()
+        if inputs is None:
+            return "break"
+        try:
+            with run.phase('parse'):
+                observations = calibration.parse_observations(observed_entry.get())
+                values = read_fields({'days': (days_entry, 0, seed_engine.DAY_COUNT),
+                                      'hours': (hours_entry, 0, 23),
+                                      'minutes': (minutes_entry, 0, 59)})
+        except ValueError as e:
+            calibration_table.show_message("Error:", str(e))
+            return "break"
+        window_size = calibration.window_minutes(values['days'] or 0, values['hours'] or 0, values['minutes'] or 0)
         
-# Initialize GUI
-root = tk.Tk()
-root.title("Pokémon R/S Live Battery Seed Searcher")
-
-# Set background color using variable
-root.configure(bg=main_background_color)
-
-# Input frame with matching background
-input_frame = tk.Frame(root, padx=10, pady=10, bg=main_background_color)
-input_frame.pack()
-
-# Create entry fields with proper placeholders
-tk.Label(input_frame, text="Year:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=0, sticky="e")
-year_entry = create_entry_with_placeholder(input_frame, 0, 1, '2000')
-
-tk.Label(input_frame, text="Month:", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=0, sticky="e")
-month_entry = create_entry_with_placeholder(input_frame, 1, 1, '1')
-
-tk.Label(input_frame, text="Day:", bg=main_background_color, fg=input_field_text_color).grid(row=2, column=0, sticky="e")
-day_entry = create_entry_with_placeholder(input_frame, 2, 1, '1')
-
-tk.Label(input_frame, text="Hour (0-23):", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=2, sticky="e")
-hour_entry = create_entry_with_placeholder(input_frame, 0, 3, '0')
-
-tk.Label(input_frame, text="Minute (0-59):", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=2, sticky="e")
-minute_entry = create_entry_with_placeholder(input_frame, 1, 3, '0')
-
-# New Seeds Count field
-tk.Label(input_frame, text="Seeds (1+):", bg=main_background_color, fg=input_field_text_color).grid(row=2, column=2, sticky="e")
-seeds_entry = create_entry_with_placeholder(input_frame, 2, 3, '10')
-
-# Calculate button with theme colors
-calculate_button = tk.Button(
-    input_frame, 
-    text="Generate Seeds", 
-    command=calculate_multiple_seeds,
-    bg=button_color,
-    fg=button_text_color,
-    activebackground='#6E5BA8',
-    activeforeground=button_text_color,
-    relief='flat'
-)
-calculate_button.grid(row=3, column=2, columnspan=2, pady=5)
-
-# Results frame with specified background
-results_frame = tk.Frame(root, padx=10, pady=10, bg=results_background)
-results_frame.pack(fill="both", expand=True)
-
-# Create style for Treeview
-style = ttk.Style()
-style.theme_use('default')
-
-# Configure Treeview
-style.configure("Treeview",
-    background="#ffffff",
-    foreground="#000000",
-    rowheight=25,
-    fieldbackground="#ffffff",
-    bordercolor="#d3d3d3",
-    borderwidth=1,
-    font=('Helvetica', 10)
-)
-style.configure("Treeview.Heading",
-    font=('Helvetica', 10, 'bold'),
-    background="#f0f0f0",
-    relief="flat"
-)
-style.map('Treeview',
-    background=[('selected', '#0078d7')],
-    foreground=[('selected', 'white')]
-)
-
-# Create Treeview
-result_tree = ttk.Treeview(
-    results_frame,
-    columns=("Time", "Seed"),
-    show="headings",
-    height=10,
-    style="Treeview",
-    selectmode="browse"
-)
-
-# Configure tags for alternating row colors
-result_tree.tag_configure('oddrow', background='#f0f0f0')
-result_tree.tag_configure('evenrow', background='#ffffff')
-
-# Configure columns
-result_tree.heading("Time", text="Time (HH:MM)")
-result_tree.heading("Seed", text="Seed")
-result_tree.column("Time", width=100, anchor="center")
-result_tree.column("Seed", width=100, anchor="center")
-
-# Display results with scrollbar
-scrollbar = ttk.Scrollbar(results_frame, orient="vertical", command=result_tree.yview)
-scrollbar.pack(side="right", fill="y")
-result_tree.configure(yscrollcommand=scrollbar.set)
-result_tree.pack(fill="both", expand=True)
-
-# Set window icon and final UI adjustments
-set_window_icon(root)
-root.after(100, lambda: [e.config(bg='white') for e in 
-                       [year_entry, month_entry, day_entry, hour_entry, minute_entry, seeds_entry]])
-
-# Bind Enter keys
-root.bind('<Return>', calculate_multiple_seeds)
-root.bind('<KP_Enter>', calculate_multiple_seeds)
-year_entry.focus_set()
-
-root.mainloop()
\ No newline at end of file
+        with run.phase('compute'):
+            candidates = calibration.solve(observations, inputs[0], window_size)
+        with run.phase('render'):
+            if not candidates.size:
+                summary_label.config(text="No offset in the window reproduces any observed seed")
+                calibration_table.show_message("No matches")
+            else:
+                best = candidates[0]
+                ties = np.count_nonzero(candidates['matches'] == best['matches']) - 1
+                text = f"Most likely offset {calibration.format_offset(best['offset'])} ({best['matches']}/{len(observations)} seeds)"
+                if ties:
+                    text += f"; {ties} other offset{'s' if ties > 1 else ''} match as well"
+                summary_label.config(text=text)
+                calibration_table.set_source(candidates.size, format_candidates)
+        run.finish()
+        timing_label.config(text=run.summary())
+        return "break"
+    
+    solve_button = make_button(form, "Solve", solve)
+    solve_button.grid(row=2, column=2, columnspan=2, pady=5)
+    window.bind('<Return>', solve)
+    window.bind('<KP_Enter>', solve)
+
+def set_range_inputs(start, count=None):
+    # Fill the main date/time (and optionally seed count) inputs
+    dt = seed_engine.minute_datetime(start)
+    for entry, value in ((year_entry, dt.year), (month_entry, dt.month), (day_entry, dt.day),
+                         (hour_entry, dt.hour), (minute_entry, dt.minute)):
+        set_entry(entry, value)
+    if count is not None:
+        set_entry(seeds_entry, count)
+
+def jump_to_minute(minute):
+    # Show a minute in the main table: select it if the current generated
+    # range holds it, otherwise generate a new range starting there
+    view = result_view
+    if (view is not None and view.in_minute_order and not filter_active()
+            and view.start <= minute < view.start + view.count):
+        result_table.select(minute - view.start)
+        return
+    set_range_inputs(minute)
+    calculate_multiple_seeds()
+    if result_view is not None and not filter_active():
+        result_table.select(0)
+
+# Heatmap rows are stretched this many pixels per day in month view
+HEATMAP_MONTH_ROW_SCALE = 12
+
+heatmap_window = None
+
+def open_heatmap():
+    # Calendar overview: one pixel per minute, one row per day
+    global heatmap_window
+    if heatmap_window is not None and heatmap_window.winfo_exists():
+        heatmap_window.lift()
+        return
+    window = heatmap_window = tk.Toplevel(root)
+    window.title("Seed Heatmap")
+    window.configure(bg=main_background_color)
+    
+    form = tk.Frame(window, padx=10, pady=10, bg=main_background_color)
+    form.pack(fill="x")
+    tk.Label(form, text="Year:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=0, sticky="e")
+    heatmap_year_entry = create_entry_with_placeholder(form, 0, 1, '2000')
+    # Leave the month blank for a whole year
+    tk.Label(form, text="Month:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=2, sticky="e")
+    heatmap_month_entry = tk.Entry(form, width=5)
+    heatmap_month_entry.grid(row=0, column=3, padx=2, pady=2)
+    # Same syntax as the filter bar; blank colours every minute by its seed
+    tk.Label(form, text="Highlight seeds:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=4, sticky="e")
+    highlight_entry = tk.Entry(form, width=25)
+    highlight_entry.grid(row=0, column=5, padx=2, pady=2)
+    hover_label = tk.Label(form, text="Click a minute to show it in the main table", bg=main_background_color, fg=input_field_text_color)
+    hover_label.grid(row=1, column=0, columnspan=6, sticky="w")
+    
+    canvas_frame = tk.Frame(window, padx=10, pady=10, bg=results_background)
+    canvas_frame.pack(fill="both", expand=True)
+    canvas = tk.Canvas(canvas_frame, width=960, height=400, bg=results_background, highlightthickness=0)
+    x_scrollbar = ttk.Scrollbar(canvas_frame, orient="horizontal", command=canvas.xview)
+    y_scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=canvas.yview)
+    canvas.configure(xscrollcommand=x_scrollbar.set, yscrollcommand=y_scrollbar.set)
+    x_scrollbar.pack(side="bottom", fill="x")
+    y_scrollbar.pack(side="right", fill="y")
+    canvas.pack(fill="both", expand=True)
+    
+    shown = {'first': None, 'days': 0, 'row_scale': 1, 'image': None}
+    
+    def render(event=None):
+        try:
+            values = read_fields({'year': (heatmap_year_entry, seed_engine.FIRST_YEAR, seed_engine.LAST_YEAR),
+                                  'month': (heatmap_month_entry, 1, 12)})
+            ranges = seed_filter.parse_filter(highlight_entry.get())
+        except ValueError as e:
+            hover_label.config(text=f"Error: {e}")
+            return "break"
+        year = values['year'] or seed_engine.FIRST_YEAR
+        
+        run = timing.start_run('heatmap')
+        with run.phase('compute'):
+            if values['month'] is None:
+                first, days = heatmap.year_range(year)
+                row_scale = 1
+            else:
+                first, days = heatmap.month_range(year, values['month'])
+                row_scale = HEATMAP_MONTH_ROW_SCALE
+            ppm = heatmap.to_ppm(heatmap.render_rgb(first, days, ranges), row_scale)
+        with run.phase('render'):
+            # One image for the whole grid, decoded by Tk in a single call
+            image = tk.PhotoImage(data=ppm, format='PPM')
+            canvas.delete("all")
+            canvas.create_image(0, 0, image=image, anchor="nw")
+            canvas.configure(scrollregion=(0, 0, image.width(), image.height()))
+        shown.update(first=first, days=days, row_scale=row_scale, image=image)
+        run.finish()
+        timing_label.config(text=run.summary())
+        return "break"
+    
+    def minute_under(event):
+        if shown['first'] is None:
+            return None
+        x, y = int(canvas.canvasx(event.x)), int(canvas.canvasy(event.y))
+        return heatmap.minute_at(shown['first'], shown['days'], x, y, shown['row_scale'])
+    
+    def on_motion(event):
+        minute = minute_under(event)
+        if minute is not None:
+            date, time = seed_engine.format_minute(minute)
+            hover_label.config(text=f"{date} {time}  seed {seed_engine.seed_for_minute(minute):04X}")
+    
+    def on_click(event):
+        minute = minute_under(event)
+        if minute is not None:
+            jump_to_minute(minute)
+    
+    canvas.bind('<Motion>', on_motion)
+    canvas.bind('<Button-1>', on_click)
+    
+    render_button = make_button(form, "Render", render)
+    render_button.grid(row=0, column=6, padx=5, pady=5)
+    window.bind('<Return>', render)
+    window.bind('<KP_Enter>', render)
+    render()
+
+# The timer display refreshes this often; the cue itself is timed off the Tk loop
+TIMER_POLL_MS = 15
+
+TIMER_PHASES = ("Reset in", "Press A in")
+
+try:
+    import winsound
+except ImportError:
+    winsound = None
+
+def play_cue(phase, late_ns):
+    # Runs on the countdown thread, so a busy Tk loop can't delay the sound
+    if winsound is not None:
+        winsound.MessageBeep()
+
+timer_window = None
+
+def open_timer(setting=None, frames=None):
+    # Plan the reset and A press for target frames, then count them down.
+    # `setting` is a (date, time, seed) results row; without one the
+    # selected row of the main table is used.
+    global timer_window
+    if timer_window is not None and timer_window.winfo_exists():
+        if setting is None:
+            timer_window.lift()
+        else:
+            # Moving through search results retargets the open window
+            # rather than rebuilding it
+            timer_window.show_setting(setting, frames)
+        return
+    if setting is None:
+        values = result_table.selected_values()
+        if values and len(values) == 3:
+            setting = values
+    window = timer_window = tk.Toplevel(root)
+    window.title("Frame Timer")
+    window.configure(bg=main_background_color)
+    
+    form = tk.Frame(window, padx=10, pady=10, bg=main_background_color)
+    form.pack(fill="x")
+    # Frames as in the target search, e.g. "1200, 1500-1510"
+    tk.Label(form, text="Target frames:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=0, sticky="e")
+    frames_entry = tk.Entry(form, width=25)
+    frames_entry.grid(row=0, column=1, columnspan=3, sticky="w", padx=2, pady=2)
+    tk.Label(form, text="Lead (s):", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=0, sticky="e")
+    lead_entry = create_entry_with_placeholder(form, 1, 1, str(timer_plan.DEFAULT_LEAD_SECONDS))
+    # Frames to add to every press, found by trial: hit frame minus target
+    tk.Label(form, text="Calibration (frames):", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=2, sticky="e")
+    calibration_entry = tk.Entry(form, width=5)
+    calibration_entry.grid(row=1, column=3, padx=2, pady=2)
+    setting_label = tk.Label(form, text="", bg=main_background_color, fg=input_field_text_color)
+    setting_label.grid(row=2, column=0, columnspan=6, sticky="w")
+    countdown_label = tk.Label(form, text="", font=('Helvetica', 24, 'bold'), bg=main_background_color, fg=input_field_text_color)
+    countdown_label.grid(row=4, column=0, columnspan=6, pady=5)
+    if winsound is None:
+        # Only Windows has a sound that can play from the countdown thread
+        tk.Label(form, text="The frame-accurate beep is Windows-only; here press A when the countdown reaches zero",
+                 bg=main_background_color, fg=input_field_text_color).grid(row=5, column=0, columnspan=6, sticky="w")
+    
+    timer_table = make_table(window, ("Frame", "Reset At", "Press A After Reset", "Total"), 140, visible_rows=8)
+    
+    plans = np.empty(0, dtype=timer_plan.PLAN_DTYPE)
+    state = {'countdown': None, 'after_id': None}
+    
+    def format_plans(first, count):
+        return [(int(p['frame']), timer_plan.format_ms(p['lead_ms']), timer_plan.format_ms(p['target_ms']),
+                 timer_plan.format_ms(p['total_ms'])) for p in plans[first:first + count]]
+    
+    def make_plans(event=None):
+        nonlocal plans
+        try:
+            frames = timer_plan.parse_frames(frames_entry.get())
+            values = read_fields({'lead': (lead_entry, 0, 3600),
+                                  'calibration': (calibration_entry, -100000, 100000)})
+            plans = timer_plan.plan(frames, values['lead'] if values['lead'] is not None else timer_plan.DEFAULT_LEAD_SECONDS,
+                                    values['calibration'] or 0)
+        except ValueError as e:
+            timer_table.show_message("Error:", str(e))
+            return "break"
+        timer_table.set_source(plans.size, format_plans)
+        timer_table.select(0)
+        return "break"
+    
+    def show_countdown():
+        state['after_id'] = None
+        countdown = state['countdown']
+        status = countdown.status()
+        if status is None:
+            late = max(countdown.late_ns, default=0) / 1e6
+            countdown_label.config(text=f"Press A now (cue {late:.1f} ms late)")
+            stop_countdown(keep_text=True)
+            return
+        phase, remaining_ns = status
+        countdown_label.config(text=f"{TIMER_PHASES[phase]} {timer_plan.format_ms(remaining_ns / 1e6)}")
+        state['after_id'] = window.after(TIMER_POLL_MS, show_countdown)
+    
+    def start_countdown():
+        if state['countdown'] is not None:
+            stop_countdown()
+            return
+        if not plans.size:
+            make_plans()
+            if not plans.size:
+                return
+        row = timer_table.selected_row
+        plan = plans[row if row is not None and row < plans.size else 0]
+        state['countdown'] = timer_plan.Countdown([plan['lead_ms'], plan['target_ms']], on_cue=play_cue).start()
+        start_button.config(text="Stop")
+        show_countdown()
+    
+    def stop_countdown(keep_text=False):
+        if state['countdown'] is not None:
+            state['countdown'].cancel()
+            state['countdown'] = None
+        if state['after_id'] is not None:
+            window.after_cancel(state['after_id'])
+            state['after_id'] = None
+        start_button.config(text="Start")
+        if not keep_text:
+            countdown_label.config(text="")
+    
+    def show_setting(setting, frames=None):
+        # A running countdown was planned for the previous row
+        stop_countdown()
+        if setting is not None:
+            setting_label.config(text=f"Set the clock to {setting[0]} {setting[1]} (seed {setting[2]})")
+        else:
+            setting_label.config(text="Select a row in the results to plan for its clock setting")
+        if frames is not None:
+            frames_entry.delete(0, tk.END)
+            frames_entry.insert(0, str(frames))
+            make_plans()
+    
+    def close():
+        stop_countdown()
+        window.destroy()
+    
+    plan_button = make_button(form, "Plan", make_plans)
+    plan_button.grid(row=3, column=0, columnspan=2, pady=5)
+    start_button = make_button(form, "Start", start_countdown)
+    start_button.grid(row=3, column=2, columnspan=2, pady=5)
+    window.bind('<Return>', make_plans)
+    window.bind('<KP_Enter>', make_plans)
+    window.protocol("WM_DELETE_WINDOW", close)
+    window.show_setting = show_setting
+    show_setting(setting, frames)
+
+def restore_last_inputs():
+    # Start from the last generated range instead of the placeholders,
+    # unless something was typed while the engine loaded
+    if sessions is None:
+        return
+    if any(entry.cget('foreground') != placeholder_style['foreground'] for entry in
+           (year_entry, month_entry, day_entry, hour_entry, minute_entry, seeds_entry)):
+        return
+    last = sessions.history('range', limit=1)
+    if last:
+        set_range_inputs(last[0]['params']['start'], last[0]['params']['count'])
+
+QUERY_KINDS = {'range': "Range", 'reverse': "Reverse lookup", 'target': "Target search"}
+
+def describe_query(query):
+    params = query['params']
+    if query['kind'] == 'range':
+        date, time = seed_engine.format_minute(params['start'])
+        return f"{date} {time}, {params['count']:,} minutes"
+    if query['kind'] == 'reverse':
+        return f"seed {params['seed']:04X}"
+    criteria = params['criteria']
+    text = f"frames {criteria['min_frame']}-{criteria['max_frame']}, {params['years'][0]}-{params['years'][1]}"
+    if criteria['natures']:
+        text += ", " + rng_search.NATURES[criteria['natures'][0]]
+    if params['tid'] is not None and params['sid'] is not None:
+        text += ", shiny"
+    return text
+
+def reopen_query(query):
+    # Run a stored query again; its results come back from the store
+    params = query['params']
+    if query['kind'] == 'range':
+        set_range_inputs(params['start'], params['count'])
+        calculate_multiple_seeds()
+    elif query['kind'] == 'reverse':
+        set_entry(seed_entry, f"{params['seed']:04X}")
+        find_times_for_seed()
+    else:
+        open_target_search(params)
+
+history_window = None
+
+def open_history():
+    # Past queries, most recently used first; selecting one reopens it
+    global history_window
+    if history_window is not None and history_window.winfo_exists():
+        history_window.lift()
+        return
+    window = history_window = tk.Toplevel(root)
+    window.title("Query History")
+    window.configure(bg=main_background_color)
+    
+    form = tk.Frame(window, padx=10, pady=10, bg=main_background_color)
+    form.pack(fill="x")
+    # Blank lists everything; a hex seed lists the lookups and searches that
+    # found it, a date/time the ranges and searches covering that minute
+    tk.Label(form, text="Seed or YYYY-MM-DD HH:MM:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=0, sticky="e")
+    find_entry = tk.Entry(form, width=20)
+    find_entry.grid(row=0, column=1, padx=2, pady=2)
+    status_label = tk.Label(form, text="", bg=main_background_color, fg=input_field_text_color)
+    status_label.grid(row=1, column=0, columnspan=3, sticky="w")
+    
+    queries = []
+    
+    def on_select(row):
+        if row < len(queries):
+            reopen_query(queries[row])
+    
+    history_columns = ("Last Used", "Kind", "Query", "Rows")
+    history_table = make_table(window, history_columns, {column: 260 if column == "Query" else 120 for column in history_columns},
+                               visible_rows=15, on_select=on_select)
+    
+    def format_queries(first, count):
+        return [(time.strftime("%Y-%m-%d %H:%M", time.localtime(query['used'])), QUERY_KINDS[query['kind']],
+                 describe_query(query), f"{query['row_count']:,}")
+                for query in queries[first:first + count]]
+    
+    def refresh(event=None):
+        nonlocal queries
+        if sessions is None:
+            history_table.show_message("History is unavailable")
+            return "break"
+        text = find_entry.get().strip()
+        try:
+            if not text:
+                queries = sessions.history()
+            elif '-' in text:
+                minute = seed_engine.minute_index(datetime.fromisoformat(text))
+                queries = sessions.queries_covering(minute)
+            else:
+                seed = int(text, 16)
+                if not (0 <= seed < seed_engine.SEED_SPACE):
+                    raise ValueError("seed must be between 0000 and FFFF")
+                queries = sessions.queries_for_seed(seed)
+        except ValueError as e:
+            status_label.config(text=f"Error: {e}")
+            return "break"
+        status_label.config(text=f"{len(queries)} quer{'y' if len(queries) == 1 else 'ies'}")
+        if queries:
+            history_table.set_source(len(queries), format_queries)
+        else:
+            history_table.show_message("None")
+        return "break"
+    
+    show_button = make_button(form, "Show", refresh)
+    show_button.grid(row=0, column=2, padx=5, pady=5)
+    find_entry.bind('<Return>', refresh)
+    find_entry.bind('<KP_Enter>', refresh)
+    refresh()
+
+if __name__ == '__main__':
+    # Search workers re-import this file on Windows; they must not build the GUI
+    multiprocessing.freeze_support()
+    
+    # Opt-in diagnostics: --trace appends a JSONL timing record per run,
+    # --profile saves a cProfile .prof per run into a directory
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--trace', metavar='FILE')
+    parser.add_argument('--profile', metavar='DIR')
+    # benchmark.py launches with this to time startup, then reads --trace
+    parser.add_argument('--exit-after-startup', action='store_true')
+    args, _ = parser.parse_known_args()
+    timing.configure(trace=args.trace, profile=args.profile)
+    
+    # Startup phases: imports, window built, first frame painted, engine loaded
+    startup = timing.start_run('startup', started=launch_time)
+    startup.add_phase('imports', time.perf_counter() - launch_time)
+    window_started = time.perf_counter()
+    
+    # Initialize GUI
+    root = tk.Tk()
+    root.title("Pokémon R/S Live Battery Seed Searcher")
+
+    # Set background color using variable
+    root.configure(bg=main_background_color)
+
+    # Input frame with matching background
+    input_frame = tk.Frame(root, padx=10, pady=10, bg=main_background_color)
+    input_frame.pack()
+
+    # Create entry fields with proper placeholders
+    tk.Label(input_frame, text="Year:", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=0, sticky="e")
+    year_entry = create_entry_with_placeholder(input_frame, 0, 1, '2000')
+
+    tk.Label(input_frame, text="Month:", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=0, sticky="e")
+    month_entry = create_entry_with_placeholder(input_frame, 1, 1, '1')
+
+    tk.Label(input_frame, text="Day:", bg=main_background_color, fg=input_field_text_color).grid(row=2, column=0, sticky="e")
+    day_entry = create_entry_with_placeholder(input_frame, 2, 1, '1')
+
+    tk.Label(input_frame, text="Hour (0-23):", bg=main_background_color, fg=input_field_text_color).grid(row=0, column=2, sticky="e")
+    hour_entry = create_entry_with_placeholder(input_frame, 0, 3, '0')
+
+    tk.Label(input_frame, text="Minute (0-59):", bg=main_background_color, fg=input_field_text_color).grid(row=1, column=2, sticky="e")
+    minute_entry = create_entry_with_placeholder(input_frame, 1, 3, '0')
+
+    # New Seeds Count field
+    tk.Label(input_frame, text="Seeds (1+):", bg=main_background_color, fg=input_field_text_color).grid(row=2, column=2, sticky="e")
+    seeds_entry = create_entry_with_placeholder(input_frame, 2, 3, '10')
+
+    # Calculate button with theme colors
+    calculate_button = make_button(input_frame, "Generate Seeds", calculate_multiple_seeds)
+    calculate_button.grid(row=3, column=2, columnspan=2, pady=5)
+
+    # Reverse lookup: seed -> clock settings
+    tk.Label(input_frame, text="Seed (hex):", bg=main_background_color, fg=input_field_text_color).grid(row=4, column=0, sticky="e")
+    seed_entry = create_entry_with_placeholder(input_frame, 4, 1, '0000')
+    seed_entry.bind('<Return>', find_times_for_seed)
+    seed_entry.bind('<KP_Enter>', find_times_for_seed)
+
+    find_button = make_button(input_frame, "Find Times for Seed", find_times_for_seed)
+    find_button.grid(row=4, column=2, columnspan=2, pady=5)
+
+    # Live clock: follows the PC clock from the entered date/time
+    tk.Label(input_frame, text="Offset (min):", bg=main_background_color, fg=input_field_text_color).grid(row=6, column=0, sticky="e")
+    offset_entry = create_entry_with_placeholder(input_frame, 6, 1, '0')
+    live_button = make_button(input_frame, "Start Live Clock", toggle_live_clock)
+    live_button.grid(row=6, column=2, columnspan=2, pady=5)
+
+    # Year range for the batch lookup and the reachability panel
+    tk.Label(input_frame, text="From Year:", bg=main_background_color, fg=input_field_text_color).grid(row=7, column=0, sticky="e")
+    batch_first_entry = create_entry_with_placeholder(input_frame, 7, 1, "2000")
+    tk.Label(input_frame, text="To Year:", bg=main_background_color, fg=input_field_text_color).grid(row=7, column=2, sticky="e")
+    batch_last_entry = create_entry_with_placeholder(input_frame, 7, 3, "2099")
+    batch_button = make_button(input_frame, "Batch Lookup...", run_batch_lookup)
+    batch_button.grid(row=8, column=2, columnspan=2, pady=5)
+
+    # Method 1 target search opens in its own window
+    target_search_button = make_button(input_frame, "Target Search...", open_target_search)
+    target_search_button.grid(row=5, column=2, columnspan=2, pady=5)
+
+    # Calendar heatmap of a month or year
+    heatmap_button = make_button(input_frame, "Heatmap...", open_heatmap)
+    heatmap_button.grid(row=8, column=0, columnspan=2, pady=5)
+
+    # Past queries from this and earlier launches
+    history_button = make_button(input_frame, "History...", open_history)
+    history_button.grid(row=9, column=0, columnspan=2, pady=5)
+
+    # Reset and A-press timing for the selected row and target frames
+    timer_button = make_button(input_frame, "Timer...", open_timer)
+    timer_button.grid(row=9, column=2, columnspan=2, pady=5)
+
+    # Clock drift calibration from observed seeds
+    calibration_button = make_button(input_frame, "Calibrate Clock...", open_calibration)
+    calibration_button.grid(row=5, column=0, columnspan=2, pady=5)
+
+    # Export the entered range to a file
+    export_button = make_button(input_frame, "Export...", export_seeds)
+    export_button.grid(row=3, column=0, columnspan=2, pady=5)
+
+    # Filter bar over the results: seeds, ranges (0000-00FF) or prefixes (A0*)
+    filter_frame = tk.Frame(root, padx=10, pady=5, bg=results_background)
+    filter_frame.pack(fill="x")
+    tk.Label(filter_frame, text="Filter seeds:", bg=results_background, fg=input_field_text_color).pack(side="left")
+    filter_entry = tk.Entry(filter_frame, width=30)
+    filter_entry.pack(side="left", padx=5)
+    filter_entry.bind('<KeyRelease>', schedule_filter)
+    filter_entry.bind('<Return>', lambda e: apply_filter())
+    filter_entry.bind('<KP_Enter>', lambda e: apply_filter())
+    sort_var = tk.BooleanVar(value=False)
+    sort_check = tk.Checkbutton(
+        filter_frame,
+        text="Sort by seed",
+        variable=sort_var,
+        command=apply_filter,
+        bg=results_background,
+        fg=input_field_text_color,
+        selectcolor=button_color,
+        activebackground=results_background,
+        activeforeground=input_field_text_color
+    )
+    sort_check.pack(side="left")
+    filter_status = tk.Label(filter_frame, text="", bg=results_background, fg=input_field_text_color)
+    filter_status.pack(side="right")
+
+    # Results frame with specified background
+    results_frame = tk.Frame(root, padx=10, pady=10, bg=results_background)
+    results_frame.pack(fill="both", expand=True)
+
+    # Create style for Treeview
+    style = ttk.Style()
+    style.theme_use('default')
+
+    # Configure Treeview
+    style.configure("Treeview",
+        background="#ffffff",
+        foreground="#000000",
+        rowheight=25,
+        fieldbackground="#ffffff",
+        bordercolor="#d3d3d3",
+        borderwidth=1,
+        font=('Helvetica', 10)
+    )
+    style.configure("Treeview.Heading",
+        font=('Helvetica', 10, 'bold'),
+        background="#f0f0f0",
+        relief="flat"
+    )
+    style.map('Treeview',
+        background=[('selected', '#0078d7')],
+        foreground=[('selected', 'white')]
+    )
+
+    # Create Treeview
+    result_tree = ttk.Treeview(
+        results_frame,
+        columns=("Date", "Time", "Seed"),
+        show="headings",
+        height=20,
+        style="Treeview",
+        selectmode="browse"
+    )
+
+    # Configure tags for alternating row colors
+    result_tree.tag_configure('oddrow', background='#f0f0f0')
+    result_tree.tag_configure('evenrow', background='#ffffff')
+    result_tree.tag_configure('current', background='#ffe08a')
+
+    # Configure columns
+    result_tree.heading("Date", text="Date")
+    result_tree.heading("Time", text="Time (HH:MM)")
+    result_tree.heading("Seed", text="Seed")
+    result_tree.column("Date", width=100, anchor="center")
+    result_tree.column("Time", width=100, anchor="center")
+    result_tree.column("Seed", width=100, anchor="center")
+
+    # PRNG frames panel for the selected seed row
+    frames_frame = tk.Frame(results_frame, padx=10, bg=results_background)
+    frames_frame.pack(side="right", fill="y")
+    frames_label = tk.Label(frames_frame, text="Frames: select a seed", bg=results_background, fg=input_field_text_color)
+    frames_label.grid(row=0, column=0, columnspan=3, sticky="w")
+    tk.Label(frames_frame, text="Jump to frame:", bg=results_background, fg=input_field_text_color).grid(row=1, column=0, sticky="e")
+    frame_entry = tk.Entry(frames_frame, width=10)
+    frame_entry.grid(row=1, column=1, sticky="w", padx=2, pady=2)
+    frame_entry.bind('<Return>', jump_to_frame)
+    frame_entry.bind('<KP_Enter>', jump_to_frame)
+
+    frames_tree = make_tree(frames_frame, ("Frame", "State", "Rand"), {"Frame": 90, "State": 90, "Rand": 60}, height=20)
+    frames_scrollbar = ttk.Scrollbar(frames_frame, orient="vertical")
+    frames_tree.grid(row=2, column=0, columnspan=2, sticky="ns")
+    frames_scrollbar.grid(row=2, column=2, sticky="ns")
+    frames_frame.rowconfigure(2, weight=1)
+    frames_table = VirtualTable(frames_tree, frames_scrollbar, visible_rows=20, row_height=25)
+
+    # Seed reachability over the From/To years, left of the results
+    reach_frame = tk.Frame(results_frame, padx=10, bg=results_background)
+    reach_frame.pack(side="left", fill="y")
+    reach_button = make_button(reach_frame, "Seed Reachability", run_reachability)
+    reach_button.grid(row=0, column=0, sticky="w")
+    unreachable_var = tk.BooleanVar(value=False)
+    unreachable_check = tk.Checkbutton(
+        reach_frame,
+        text="Unreachable only",
+        variable=unreachable_var,
+        command=show_reachability,
+        bg=results_background,
+        fg=input_field_text_color,
+        selectcolor=button_color,
+        activebackground=results_background,
+        activeforeground=input_field_text_color
+    )
+    unreachable_check.grid(row=0, column=1, sticky="e")
+    reach_label = tk.Label(reach_frame, text="Uses the From/To years", justify="left", anchor="w",
+                           bg=results_background, fg=input_field_text_color)
+    reach_label.grid(row=1, column=0, columnspan=3, sticky="w")
+    reach_tree = make_tree(reach_frame, ("Seed", "Count", "Earliest", "Latest"),
+                           {"Seed": 60, "Count": 60, "Earliest": 130, "Latest": 130}, height=16)
+    reach_scrollbar = ttk.Scrollbar(reach_frame, orient="vertical")
+    reach_tree.grid(row=2, column=0, columnspan=2, sticky="ns")
+    reach_scrollbar.grid(row=2, column=2, sticky="ns")
+    reach_frame.rowconfigure(2, weight=1)
+    reach_table = VirtualTable(reach_tree, reach_scrollbar, visible_rows=16, row_height=25, on_select=use_reach_seed)
+
+    # Display results with scrollbar; only the visible rows exist as Treeview items
+    scrollbar = ttk.Scrollbar(results_frame, orient="vertical")
+    scrollbar.pack(side="right", fill="y")
+    result_tree.pack(fill="both", expand=True)
+    result_table = VirtualTable(result_tree, scrollbar, visible_rows=20, row_height=25, on_select=show_frames)
+
+    # Progress of background generation, with a way to stop it
+    status_frame = tk.Frame(root, padx=10, pady=5, bg=results_background)
+    status_frame.pack(fill="x")
+    progress_bar = ttk.Progressbar(status_frame, orient="horizontal", mode="determinate", maximum=1.0)
+    progress_bar.pack(side="left", fill="x", expand=True)
+    cancel_button = make_button(status_frame, "Cancel", cancel_job, state='disabled')
+    cancel_button.pack(side="right", padx=(5, 0))
+
+    # Phase timings of the last run
+    timing_label = tk.Label(root, text="", anchor="w", padx=10, bg=results_background, fg=input_field_text_color)
+    timing_label.pack(fill="x")
+
+    # Set window icon and final UI adjustments
+    set_window_icon(root)
+
+    # Regenerate as the user types
+    for field, entry in (('year', year_entry), ('month', month_entry), ('day', day_entry),
+                         ('hour', hour_entry), ('minute', minute_entry), ('seeds', seeds_entry)):
+        entry.bind('<KeyRelease>', schedule_recompute(field), add='+')
+
+    # Bind Enter keys
+    root.bind('<Return>', calculate_multiple_seeds)
+    root.bind('<KP_Enter>', calculate_multiple_seeds)
+    year_entry.focus_set()
+    startup.add_phase('window', time.perf_counter() - window_started)
+
+    # Paint the window before the engine loads; input that arrives meanwhile
+    # is queued and handled once it has
+    with startup.phase('first frame'):
+        root.update()
+    with startup.phase('engine'):
+        load_engine()
+        restore_last_inputs()
+    startup.finish()
+    timing_label.config(text=startup.summary())
+
+    if args.exit_after_startup:
+        root.destroy()
+    else:
+        root.mainloop()
+
+    # Don't leave the last shared-memory block behind in the system, and
+    # write out any queries still waiting for the next batch
+    if result_block is not None:
+        result_block.release()
+    if sessions is not None:
+        sessions.close()
@@ -0,0 +1,76 @@
+import calendar
+from datetime import datetime
+
+import numpy as np
+
+import seed_engine
+
+# Seed colours: a dark-to-bright gradient through these anchors, indexed by
+# seed value
+PALETTE_ANCHORS = np.array([
+    (0x1B, 0x10, 0x3A),
+    (0x5D, 0x4A, 0x8F),
+    (0x2A, 0x9D, 0x8F),
+    (0xE9, 0xC4, 0x6A),
+    (0xFF, 0xF4, 0xD6),
+], dtype=np.float64)
+
+# Target-hit mode: matching minutes are bright on a dark background
+HIT_COLOR = (0xFF, 0xE0, 0x8A)
+MISS_COLOR = (0x2B, 0x22, 0x45)
+
+
+def _palette():
+    positions = np.linspace(0, seed_engine.SEED_SPACE - 1, len(PALETTE_ANCHORS))
+    seeds = np.arange(seed_engine.SEED_SPACE)
+    channels = [np.interp(seeds, positions, PALETTE_ANCHORS[:, c]) for c in range(3)]
+    return np.stack(channels, axis=1).round().astype(np.uint8)
+
+
+PALETTE = _palette()
+
+
+def month_range(year, month):
+    """(first minute, day count) of a calendar month"""
+    first = seed_engine.minute_index(datetime(year, month, 1))
+    return first, calendar.monthrange(year, month)[1]
+
+
+def year_range(year):
+    """(first minute, day count) of a calendar year"""
+    first, end = seed_engine.year_range(year, year)
+    return first, (end - first) // seed_engine.MINUTES_PER_DAY
+
+
+def render_rgb(first_minute, days, ranges=None):
+    """(days, 1440, 3) uint8 image: one row per day, one column per minute
+
+    Without `ranges` every minute is coloured by its seed; with a list of
+    inclusive (lo, hi) seed ranges only the matching minutes light up.
+    """
+    seeds = seed_engine.seeds_for_range(first_minute, days * seed_engine.MINUTES_PER_DAY)
+    if ranges is None:
+        rgb = PALETTE[seeds]
+    else:
+        lookup = np.empty((seed_engine.SEED_SPACE, 3), dtype=np.uint8)
+        lookup[:] = MISS_COLOR
+        for lo, hi in ranges:
+            lookup[lo:hi + 1] = HIT_COLOR
+        rgb = lookup[seeds]
+    return rgb.reshape(days, seed_engine.MINUTES_PER_DAY, 3)
+
+
+def to_ppm(rgb, row_scale=1):
+    """Binary PPM bytes for an image, each row repeated row_scale times"""
+    if row_scale > 1:
+        rgb = np.repeat(rgb, row_scale, axis=0)
+    height, width = rgb.shape[:2]
+    return b"P6 %d %d 255\n" % (width, height) + np.ascontiguousarray(rgb).tobytes()
+
+
+def minute_at(first_minute, days, x, y, row_scale=1):
+    """Minute index under image pixel (x, y), or None outside the image"""
+    day = y // row_scale
+    if not (0 <= x < seed_engine.MINUTES_PER_DAY and 0 <= day < days):
+        return None
+    return first_minute + day * seed_engine.MINUTES_PER_DAY + x
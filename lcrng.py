@@ -0,0 +1,74 @@
+import numpy as np
+
+# Gen 3 PRNG: state = state * MULT + ADD (mod 2^32). The value the game uses
+# for each call is the upper 16 bits of the new state. Frame N is the state
+# after N advances from the initial seed, so frame 0 is the seed itself.
+MULT = 0x41C64E6D
+ADD = 0x6073
+MASK = 0xFFFFFFFF
+PERIOD = 1 << 32
+
+
+def _jump_table():
+    # Entry k advances the state by 2^k frames in a single multiply-add
+    table = []
+    mult, add = MULT, ADD
+    for _ in range(32):
+        table.append((mult, add))
+        mult, add = (mult * mult) & MASK, (add * (mult + 1)) & MASK
+    return table
+
+
+JUMP_TABLE = _jump_table()
+JUMP_MULTS = np.array([mult for mult, _ in JUMP_TABLE], dtype=np.uint32)
+JUMP_ADDS = np.array([add for _, add in JUMP_TABLE], dtype=np.uint32)
+
+
+def next_state(state):
+    return (state * MULT + ADD) & MASK
+
+
+def rand(state):
+    """16-bit value the game reads from a state"""
+    return state >> 16
+
+
+def jump(state, frames):
+    """State after `frames` advances, in at most 32 multiply-adds"""
+    frames %= PERIOD
+    k = 0
+    while frames:
+        if frames & 1:
+            mult, add = JUMP_TABLE[k]
+            state = (state * mult + add) & MASK
+        frames >>= 1
+        k += 1
+    return state
+
+
+def jump_array(states, frames):
+    """Advance every state by `frames` (a scalar or one count per state)
+
+    uint32 arithmetic wraps modulo 2^32, which is exactly the LCRNG modulus.
+    """
+    states = np.array(states, dtype=np.uint32)
+    frames = np.asarray(frames, dtype=np.uint64) % PERIOD
+    with np.errstate(over='ignore'):
+        for k in range(32):
+            take = ((frames >> np.uint64(k)) & np.uint64(1)).astype(bool)
+            if take.any():
+                states = np.where(take, states * JUMP_MULTS[k] + JUMP_ADDS[k], states)
+    return states
+
+
+def states_window(states, count):
+    """(count, len(states)) array: row i holds every state advanced i frames"""
+    states = np.asarray(states, dtype=np.uint32)
+    out = np.empty((count, states.size), dtype=np.uint32)
+    if count == 0:
+        return out
+    out[0] = states
+    for i in range(1, count):
+        np.multiply(out[i - 1], np.uint32(MULT), out=out[i])
+        out[i] += np.uint32(ADD)
+    return out
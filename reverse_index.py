@@ -0,0 +1,135 @@
+import os
+import tempfile
+
+import numpy as np
+
+import seed_engine
+
+# File layout: header, then (SEED_SPACE + 1) uint32 bucket offsets, then one
+# uint32 minute index per representable minute grouped by seed. The minutes
+# for seed s are minutes[offsets[s]:offsets[s + 1]], in ascending order.
+INDEX_PATH = os.path.join(seed_engine.DATA_DIR, "reverse_index.bin")
+MAGIC = b"RSRIDX01"
+HEADER_DTYPE = np.dtype([('magic', 'S8'), ('minute_count', '<u4'), ('seed_space', '<u4')])
+INDEX_DTYPE = np.dtype('<u4')
+
+
+def _offsets_start():
+    return HEADER_DTYPE.itemsize
+
+
+def _minutes_start():
+    return HEADER_DTYPE.itemsize + (seed_engine.SEED_SPACE + 1) * INDEX_DTYPE.itemsize
+
+
+def iter_build_index(path=INDEX_PATH):
+    """Write the seed -> minute index for every representable minute
+
+    Yields the fraction of work done after each chunk. Closing the generator
+    early abandons the build and removes the partial file.
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    total = seed_engine.MINUTE_COUNT
+
+    # First pass: bucket sizes
+    counts = np.zeros(seed_engine.SEED_SPACE, dtype=np.int64)
+    for chunk_start, seeds in seed_engine.iter_seed_chunks(0, total):
+        counts += np.bincount(seeds, minlength=seed_engine.SEED_SPACE)
+        yield 0.25 * (chunk_start + seeds.size) / total
+    offsets = np.zeros(seed_engine.SEED_SPACE + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+
+    # Second pass: scatter each chunk's minutes into their buckets. Chunks
+    # arrive in minute order and the sort is stable, so buckets stay sorted.
+    # Each build writes its own temp file, so builds in other processes (or
+    # an abandoned one still winding down) can't remove or clobber it
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(path) + ".", suffix=".tmp",
+                                     dir=os.path.dirname(path))
+    header = np.array([(MAGIC, total, seed_engine.SEED_SPACE)], dtype=HEADER_DTYPE)
+    with os.fdopen(fd, "wb") as f:
+        f.write(header.tobytes())
+        f.write(offsets.astype(INDEX_DTYPE).tobytes())
+        f.truncate(_minutes_start() + total * INDEX_DTYPE.itemsize)
+    minutes = np.memmap(temp_path, dtype=INDEX_DTYPE, mode="r+", offset=_minutes_start(), shape=(total,))
+    finished = False
+    try:
+        cursor = offsets[:-1].copy()
+        for chunk_start, seeds in seed_engine.iter_seed_chunks(0, total):
+            order = np.argsort(seeds, kind="stable")
+            sorted_seeds = seeds[order]
+            chunk_counts = np.bincount(sorted_seeds, minlength=seed_engine.SEED_SPACE)
+            group_start = np.zeros(seed_engine.SEED_SPACE, dtype=np.int64)
+            np.cumsum(chunk_counts[:-1], out=group_start[1:])
+            rank = np.arange(seeds.size) - group_start[sorted_seeds]
+            minutes[cursor[sorted_seeds] + rank] = chunk_start + order
+            cursor += chunk_counts
+            yield 0.25 + 0.75 * (chunk_start + seeds.size) / total
+        minutes.flush()
+        finished = True
+    finally:
+        # The map has to be closed before the file can be moved on Windows
+        del minutes
+        if finished:
+            try:
+                os.replace(temp_path, path)
+            except OSError:
+                # Another build got there first (and may have the file
+                # mapped); its index is as good as this one
+                os.remove(temp_path)
+                if not _valid_index(path):
+                    raise
+        else:
+            os.remove(temp_path)
+
+
+def build_index(path=INDEX_PATH):
+    """Write the reverse index file, replacing any existing one"""
+    for _ in iter_build_index(path):
+        pass
+
+
+class SeedIndex:
+    """Memory-mapped seed -> minute lookup"""
+
+    def __init__(self, path=INDEX_PATH):
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if (header.size != 1 or header['magic'][0] != MAGIC
+                or header['minute_count'][0] != seed_engine.MINUTE_COUNT
+                or header['seed_space'][0] != seed_engine.SEED_SPACE):
+            raise ValueError(f"{path} is not a reverse index for this seed engine")
+        self.offsets = np.memmap(path, dtype=INDEX_DTYPE, mode="r", offset=_offsets_start(),
+                                 shape=(seed_engine.SEED_SPACE + 1,))
+        self.minutes = np.memmap(path, dtype=INDEX_DTYPE, mode="r", offset=_minutes_start(),
+                                 shape=(seed_engine.MINUTE_COUNT,))
+
+    def minutes_for_seed(self, seed):
+        """Minute indices (ascending) whose clock setting gives `seed`"""
+        if not (0 <= seed < seed_engine.SEED_SPACE):
+            raise ValueError("seed must be between 0000 and FFFF")
+        return self.minutes[self.offsets[seed]:self.offsets[seed + 1]]
+
+
+_index = None
+
+
+def _valid_index(path):
+    try:
+        SeedIndex(path)
+    except (OSError, ValueError):
+        return False
+    return True
+
+
+def index_ready(path=INDEX_PATH):
+    """True if a valid index file already exists"""
+    return _index is not None or _valid_index(path)
+
+
+def open_index(path=INDEX_PATH):
+    """Open the reverse index, building it on first use"""
+    global _index
+    if _index is None:
+        if not index_ready(path):
+            build_index(path)
+        _index = SeedIndex(path)
+    return _index
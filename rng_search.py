@@ -0,0 +1,196 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import os
+
+import numpy as np
+
+import lcrng
+import seed_engine
+
+NATURES = [
+    'Hardy', 'Lonely', 'Brave', 'Adamant', 'Naughty',
+    'Bold', 'Docile', 'Relaxed', 'Impish', 'Lax',
+    'Timid', 'Hasty', 'Serious', 'Jolly', 'Naive',
+    'Modest', 'Mild', 'Quiet', 'Bashful', 'Rash',
+    'Calm', 'Gentle', 'Sassy', 'Careful', 'Quirky',
+]
+STATS = ('HP', 'Atk', 'Def', 'SpA', 'SpD', 'Spe')
+
+# Method 1: the spread at frame N reads the next four values after the
+# frame-N state: PID low, PID high, then two IV words. The first IV word
+# packs HP/Atk/Def and the second Spe/SpA/SpD, five bits each.
+IV_WORD_STATS = (('HP', 'Atk', 'Def'), ('Spe', 'SpA', 'SpD'))
+
+HIT_DTYPE = np.dtype([('seed', '<u2'), ('frame', '<u4'), ('pid', '<u4'), ('iv1', '<u2'), ('iv2', '<u2')])
+
+# Seeds per task and frames per block inside a task; a block is
+# FRAME_BLOCK x SEEDS_PER_TASK states, about 8 MB
+SEEDS_PER_TASK = 1024
+FRAME_BLOCK = 2048
+
+# Only the first hits by frame are kept; each one ranks ~800 clock settings,
+# so loose criteria (every frame matches) would otherwise run out of memory
+MAX_HITS = 2000
+
+
+def make_criteria(max_frame, iv_min=None, iv_max=None, natures=None, tid=None, sid=None, min_frame=0):
+    """Search criteria as a plain dict (it is sent to worker processes)
+
+    iv_min/iv_max map stat names to bounds; natures is a collection of nature
+    names or None for any; tid/sid turn on the shiny check when both are given.
+    """
+    iv_min = {stat: 0 for stat in STATS} | (iv_min or {})
+    iv_max = {stat: 31 for stat in STATS} | (iv_max or {})
+    for stat in STATS:
+        if not (0 <= iv_min[stat] <= iv_max[stat] <= 31):
+            raise ValueError(f"{stat} IV range must be within 0-31")
+    if not (0 <= min_frame <= max_frame):
+        raise ValueError("frame range is empty")
+    nature_ids = None
+    if natures:
+        nature_ids = sorted(NATURES.index(nature) for nature in natures)
+    shiny = None
+    if tid is not None and sid is not None:
+        shiny = (tid ^ sid) & 0xFFFF
+    return {
+        'min_frame': min_frame,
+        'max_frame': max_frame,
+        'iv_min': iv_min,
+        'iv_max': iv_max,
+        'natures': nature_ids,
+        'shiny': shiny,
+    }
+
+
+def _iv_word_table(stats, criteria):
+    # Accept/reject every possible 16-bit IV word in one lookup
+    words = np.arange(1 << 16, dtype=np.uint32)
+    ok = np.ones(1 << 16, dtype=bool)
+    for position, stat in enumerate(stats):
+        iv = (words >> (5 * position)) & 31
+        ok &= (iv >= criteria['iv_min'][stat]) & (iv <= criteria['iv_max'][stat])
+    return ok
+
+
+def ivs(iv1, iv2):
+    """Dict of the six IVs from the two Method 1 IV words"""
+    values = {}
+    for word, stats in zip((iv1, iv2), IV_WORD_STATS):
+        for position, stat in enumerate(stats):
+            values[stat] = (int(word) >> (5 * position)) & 31
+    return values
+
+
+def first_hits(chunks, limit=MAX_HITS):
+    """The first `limit` hits by frame then seed from a list of HIT_DTYPE arrays"""
+    hits = np.concatenate(chunks) if chunks else np.empty(0, dtype=HIT_DTYPE)
+    # lexsort on the two fields is much faster than sorting the records
+    return hits[np.lexsort((hits['seed'], hits['frame']))[:limit]]
+
+
+def search_seeds(seed_lo, seed_hi, criteria, limit=MAX_HITS):
+    """Method 1 hits for initial seeds seed_lo..seed_hi-1, as a HIT_DTYPE array
+
+    Only the first `limit` hits by frame are returned (None for all).
+    """
+    iv1_ok = _iv_word_table(IV_WORD_STATS[0], criteria)
+    iv2_ok = _iv_word_table(IV_WORD_STATS[1], criteria)
+    nature_ok = None
+    if criteria['natures'] is not None:
+        nature_ok = np.zeros(25, dtype=bool)
+        nature_ok[criteria['natures']] = True
+
+    seeds = np.arange(seed_lo, seed_hi, dtype=np.uint32)
+    states = lcrng.jump_array(seeds, criteria['min_frame'])
+    hits = []
+    found_count = 0
+    frame = criteria['min_frame']
+    # Blocks run in frame order, so once `limit` hits are in, later blocks
+    # can't contribute
+    while frame <= criteria['max_frame'] and (limit is None or found_count < limit):
+        block = min(FRAME_BLOCK, criteria['max_frame'] - frame + 1)
+        # Row j is the state at frame + j; each spread needs four more
+        window = lcrng.states_window(states, block + 4)
+        rands = window >> 16
+        r1, r2 = rands[1:block + 1], rands[2:block + 2]
+        r3, r4 = rands[3:block + 3], rands[4:block + 4]
+
+        # IV tables are the cheapest filter, so apply them first
+        mask = iv1_ok[r3] & iv2_ok[r4]
+        offsets, lanes = np.nonzero(mask)
+        if lanes.size:
+            low, high = r1[offsets, lanes], r2[offsets, lanes]
+            pid = (high << 16) | low
+            keep = np.ones(lanes.size, dtype=bool)
+            if nature_ok is not None:
+                keep &= nature_ok[pid % 25]
+            if criteria['shiny'] is not None:
+                keep &= (criteria['shiny'] ^ low ^ high) < 8
+            offsets, lanes = offsets[keep], lanes[keep]
+            found = np.empty(lanes.size, dtype=HIT_DTYPE)
+            found['seed'] = seeds[lanes]
+            found['frame'] = frame + offsets
+            found['pid'] = pid[keep]
+            found['iv1'] = r3[offsets, lanes]
+            found['iv2'] = r4[offsets, lanes]
+            hits.append(found)
+            found_count += found.size
+
+        states = window[block]
+        frame += block
+    return first_hits(hits, limit)
+
+
+def iter_search(criteria, workers=None, limit=MAX_HITS):
+    """Search all 65,536 initial seeds across a process pool
+
+    Yields (fraction done, hits) as each task finishes; each task returns at
+    most `limit` hits. Closing the generator cancels the tasks that have not
+    started yet.
+    """
+    tasks = range(0, seed_engine.SEED_SPACE, SEEDS_PER_TASK)
+    executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+    try:
+        futures = [executor.submit(search_seeds, lo, lo + SEEDS_PER_TASK, criteria, limit) for lo in tasks]
+        for done, future in enumerate(as_completed(futures), 1):
+            yield done / len(futures), future.result()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def search(criteria, workers=None, limit=MAX_HITS):
+    """The first `limit` hits (None for all), sorted by frame then seed"""
+    hits = first_hits([], limit)
+    for _, chunk in iter_search(criteria, workers, limit):
+        # Merge as tasks finish so at most 2 * limit hits are held
+        hits = first_hits([hits, chunk], limit)
+    return hits
+
+
+def rank_clock_settings(hits, index, first_minute=0, last_minute=seed_engine.MINUTE_COUNT):
+    """Join hits with the clock settings that produce their seeds
+
+    Returns (minutes, hit_rows): one entry per clock setting within
+    [first_minute, last_minute), ranked by frame (fewest advances to wait
+    through first) and then by minute.
+    """
+    # The index is read once per distinct seed, then every hit takes its
+    # seed's minutes by position
+    seeds, seed_of_hit = np.unique(hits['seed'], return_inverse=True)
+    seed_minutes = []
+    for seed in seeds.tolist():
+        minutes = index.minutes_for_seed(seed)
+        lo, hi = np.searchsorted(minutes, [first_minute, last_minute])
+        seed_minutes.append(np.asarray(minutes[lo:hi], dtype=np.int64))
+    counts = np.array([m.size for m in seed_minutes], dtype=np.int64)
+    starts = np.zeros(seeds.size, dtype=np.int64)
+    np.cumsum(counts[:-1], out=starts[1:])
+    all_minutes = np.concatenate(seed_minutes) if seed_minutes else np.empty(0, dtype=np.int64)
+
+    per_hit = counts[seed_of_hit]
+    hit_rows = np.repeat(np.arange(hits.size, dtype=np.int64), per_hit)
+    hit_starts = np.zeros(hits.size, dtype=np.int64)
+    np.cumsum(per_hit[:-1], out=hit_starts[1:])
+    rank = np.arange(hit_rows.size, dtype=np.int64) - hit_starts[hit_rows]
+    minutes = all_minutes[starts[seed_of_hit][hit_rows] + rank]
+    order = np.lexsort((minutes, hits['frame'][hit_rows]))
+    return minutes[order], hit_rows[order]
@@ -0,0 +1,75 @@
+from collections import OrderedDict
+import threading
+
+import numpy as np
+
+import seed_engine
+
+# Seeds are cached in aligned blocks of absolute minute indices
+BLOCK_MINUTES = 4096
+
+
+class SeedCache:
+    """LRU cache of seeds by absolute minute index
+
+    A lookup only computes the blocks it doesn't already hold, so nudging
+    the start minute or the count reuses almost everything from the last
+    query. Safe to share between threads.
+    """
+
+    def __init__(self, max_minutes=1 << 23):
+        self.max_blocks = max(1, max_minutes // BLOCK_MINUTES)
+        self.blocks = OrderedDict()
+        self.lock = threading.Lock()
+
+    def _compute(self, first_block, block_count):
+        # One engine call for a run of missing blocks
+        start = first_block * BLOCK_MINUTES
+        count = min(block_count * BLOCK_MINUTES, seed_engine.MINUTE_COUNT - start)
+        seeds = seed_engine.seeds_for_range(start, count)
+        for i in range(block_count):
+            self.blocks[first_block + i] = seeds[i * BLOCK_MINUTES:(i + 1) * BLOCK_MINUTES]
+
+    def get(self, start, count, out=None):
+        """Seeds for `count` minutes from `start`, reusing cached blocks"""
+        seed_engine.check_range(start, count)
+        if out is None:
+            out = np.empty(count, dtype=seed_engine.SEED_DTYPE)
+        if count == 0:
+            return out
+        first_block = start // BLOCK_MINUTES
+        last_block = (start + count - 1) // BLOCK_MINUTES
+        with self.lock:
+            block = first_block
+            while block <= last_block:
+                if block not in self.blocks:
+                    run = 1
+                    while block + run <= last_block and block + run not in self.blocks:
+                        run += 1
+                    self._compute(block, run)
+                    run_end = block + run
+                    # Copy the fresh run out before eviction can reach it
+                    for b in range(block, run_end):
+                        self._copy(b, start, count, out)
+                    self._evict()
+                    block = run_end
+                    continue
+                self._copy(block, start, count, out)
+                block += 1
+        return out
+
+    def _copy(self, block, start, count, out):
+        seeds = self.blocks[block]
+        self.blocks.move_to_end(block)
+        block_start = block * BLOCK_MINUTES
+        lo = max(start, block_start)
+        hi = min(start + count, block_start + seeds.size)
+        out[lo - start:hi - start] = seeds[lo - block_start:hi - block_start]
+
+    def _evict(self):
+        while len(self.blocks) > self.max_blocks:
+            self.blocks.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.blocks.clear()
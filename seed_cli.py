@@ -0,0 +1,80 @@
+"""Headless seed tables: python seed_cli.py --start 2000-01-01T00:00 --end 2001-01-01T00:00"""
+import argparse
+from datetime import datetime, timedelta
+import sys
+
+import seed_engine
+import seed_export
+import shared_seeds
+
+
+def parse_datetime(text):
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid date/time: {text!r} (expected YYYY-MM-DDTHH:MM)")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Stream Ruby/Sapphire live battery seeds for a date range")
+    parser.add_argument('--start', type=parse_datetime, required=True,
+                        help="first minute, e.g. 2000-01-01T00:00")
+    end = parser.add_mutually_exclusive_group()
+    end.add_argument('--end', type=parse_datetime,
+                     help="end of the range (exclusive); defaults to one day after --start")
+    end.add_argument('--count', type=int, help="number of minutes instead of --end")
+    parser.add_argument('--format', choices=seed_export.FORMATS, default='csv')
+    parser.add_argument('--output', '-o', help="output file (default: stdout)")
+    parser.add_argument('--workers', type=int, metavar='N',
+                        help="generate the range in N processes through shared memory first")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    try:
+        start = seed_engine.minute_index(args.start)
+        if args.count is not None:
+            count = args.count
+        else:
+            end = args.end or args.start + timedelta(days=1)
+            if end <= args.start:
+                raise ValueError("--end must be after --start")
+            # The range may end exactly at 2100-01-01, one past the last minute
+            if end == seed_engine.minute_datetime(seed_engine.MINUTE_COUNT):
+                count = seed_engine.MINUTE_COUNT - start
+            else:
+                count = seed_engine.minute_index(end) - start
+        seed_engine.check_range(start, count)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    shared = None
+    source = seed_engine.seeds_for_range
+    if args.workers:
+        # The formatter reads straight out of the workers' shared block
+        shared = shared_seeds.generate(start, count, args.workers)
+        source = shared.get
+    try:
+        if args.output:
+            with open(args.output, "wb") as f:
+                seed_export.write_range(f, start, count, args.format, source=source)
+        else:
+            try:
+                seed_export.write_range(sys.stdout.buffer, start, count, args.format, source=source)
+                sys.stdout.buffer.flush()
+            except BrokenPipeError:
+                # Downstream closed early (e.g. piped into head)
+                sys.stderr.close()
+    finally:
+        if shared is not None:
+            shared.release()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
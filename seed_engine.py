@@ -0,0 +1,149 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+import os
+
+import numpy as np
+
+# The cartridge RTC stores a two-digit year, so every clock setting falls
+# between 2000-01-01 00:00 and 2099-12-31 23:59. Minutes are addressed by an
+# absolute minute index counted from the start of that range.
+EPOCH = datetime(2000, 1, 1)
+FIRST_YEAR = 2000
+LAST_YEAR = 2099
+MINUTES_PER_DAY = 24 * 60
+DAY_COUNT = (datetime(LAST_YEAR + 1, 1, 1) - EPOCH).days
+MINUTE_COUNT = DAY_COUNT * MINUTES_PER_DAY
+
+SEED_DTYPE = np.uint16
+SEED_SPACE = 1 << 16
+
+# Precomputed tables and caches are kept here between runs
+DATA_DIR = os.path.join(os.path.expanduser("~"), ".rs_live_battery")
+
+# Days are processed in blocks so temporaries stay cache-sized
+DAYS_PER_CHUNK = 2048
+
+
+def _hex_minute_offsets():
+    # The hour and minute are read as if their decimal digits were hex,
+    # e.g. 23:59 contributes 60 * 0x23 + 0x59
+    offsets = np.empty(MINUTES_PER_DAY, dtype=np.int32)
+    for hour in range(24):
+        for minute in range(60):
+            offsets[hour * 60 + minute] = 60 * int(f"{hour:02d}", 16) + int(f"{minute:02d}", 16)
+    return offsets
+
+
+HEX_MINUTE_OFFSETS = _hex_minute_offsets()
+
+
+def day_counter(day_index):
+    """Cartridge day counter for a day index (days since 2000-01-01)"""
+    # Days are counted from 1999-12-31, minus 366 once the year is past 2000
+    day_index = np.asarray(day_index, dtype=np.int64)
+    return np.where(day_index >= 366, day_index - 365, day_index + 1)
+
+
+# Calendar tables for the whole representable range. DAY_COUNTERS maps a day
+# index (days since 2000-01-01) to the cartridge day counter, and
+# DAY_TOTALS holds that counter already multiplied out to minutes, so a seed
+# is one read from each table, an add, and the shift/XOR fold.
+DAY_COUNTERS = day_counter(np.arange(DAY_COUNT)).astype(np.uint16)
+# The largest total in range is ~52M, so int32 is wide enough
+DAY_TOTALS = DAY_COUNTERS.astype(np.int32) * MINUTES_PER_DAY
+
+# Plain-list copies for scalar lookups, which are faster than indexing NumPy
+_day_totals = DAY_TOTALS.tolist()
+_hex_minute_offsets_list = HEX_MINUTE_OFFSETS.tolist()
+
+TIME_STRINGS = [f"{hour:02d}:{minute:02d}" for hour in range(24) for minute in range(60)]
+
+
+@lru_cache(maxsize=4096)
+def date_string(day):
+    """YYYY-MM-DD for a day index"""
+    return (EPOCH + timedelta(days=day)).strftime("%Y-%m-%d")
+
+
+def format_minute(index):
+    """(YYYY-MM-DD, HH:MM) strings for a minute index"""
+    day, minute_of_day = divmod(int(index), MINUTES_PER_DAY)
+    return date_string(day), TIME_STRINGS[minute_of_day]
+
+
+def minute_index(dt):
+    """Absolute minute index of a datetime"""
+    delta = dt - EPOCH
+    index = delta.days * MINUTES_PER_DAY + delta.seconds // 60
+    if not (0 <= index < MINUTE_COUNT):
+        raise ValueError(f"date must be between {FIRST_YEAR} and {LAST_YEAR}")
+    return index
+
+
+def minute_datetime(index):
+    """Datetime for an absolute minute index"""
+    return EPOCH + timedelta(minutes=int(index))
+
+
+def year_range(first_year, last_year):
+    """(first minute, end minute) covering whole years first_year..last_year"""
+    if not (FIRST_YEAR <= first_year <= last_year <= LAST_YEAR):
+        raise ValueError(f"years must be between {FIRST_YEAR} and {LAST_YEAR}, first <= last")
+    first = minute_index(datetime(first_year, 1, 1))
+    end = MINUTE_COUNT if last_year == LAST_YEAR else minute_index(datetime(last_year + 1, 1, 1))
+    return first, end
+
+
+def seed_for_minute(index):
+    """Initial seed for a single minute index"""
+    day, minute_of_day = divmod(index, MINUTES_PER_DAY)
+    total = _day_totals[day] + _hex_minute_offsets_list[minute_of_day]
+    return (total >> 16) ^ (total & 0xFFFF)
+
+
+def check_range(start, count):
+    """Raise ValueError unless the minute range is representable"""
+    if count < 0:
+        raise ValueError("count must not be negative")
+    if start < 0 or start + count > MINUTE_COUNT:
+        raise ValueError(f"minute range must stay between {FIRST_YEAR} and {LAST_YEAR}")
+
+
+def seeds_for_range(start, count, out=None):
+    """Seeds for `count` consecutive minutes starting at minute index `start`
+
+    Whole days are computed at once as a (days x 1440) grid of day totals
+    plus hex-minute offsets, then sliced down to the requested minutes.
+    """
+    check_range(start, count)
+    if out is None:
+        out = np.empty(count, dtype=SEED_DTYPE)
+    if count == 0:
+        return out
+
+    first_day = start // MINUTES_PER_DAY
+    last_day = (start + count - 1) // MINUTES_PER_DAY + 1
+    written = 0
+    for chunk_day in range(first_day, last_day, DAYS_PER_CHUNK):
+        chunk_end = min(chunk_day + DAYS_PER_CHUNK, last_day)
+        total = (DAY_TOTALS[chunk_day:chunk_end, None] + HEX_MINUTE_OFFSETS[None, :]).ravel()
+
+        # Trim the partial days at either end of the range
+        lo = max(start - chunk_day * MINUTES_PER_DAY, 0)
+        hi = min(start + count - chunk_day * MINUTES_PER_DAY, total.size)
+        total = total[lo:hi]
+
+        seeds = total >> 16
+        total &= 0xFFFF
+        seeds ^= total
+        out[written:written + seeds.size] = seeds
+        written += seeds.size
+    return out
+
+
+def iter_seed_chunks(start, count, chunk_size=DAYS_PER_CHUNK * MINUTES_PER_DAY):
+    """Yield (chunk_start, seeds) pairs covering a minute range"""
+    check_range(start, count)
+    end = start + count
+    for chunk_start in range(start, end, chunk_size):
+        yield chunk_start, seeds_for_range(chunk_start, min(chunk_size, end - chunk_start))
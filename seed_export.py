@@ -0,0 +1,69 @@
+import numpy as np
+
+import seed_engine
+
+FORMATS = ('csv', 'jsonl', 'bin')
+
+# Packed binary layout: header, then `count` little-endian uint16 seeds for
+# consecutive minutes starting at minute index `start`
+BIN_MAGIC = b"RSSEEDS1"
+BIN_HEADER_DTYPE = np.dtype([('magic', 'S8'), ('start', '<u4'), ('count', '<u4')])
+
+# Minutes per chunk; keeps memory flat no matter how long the range is
+EXPORT_CHUNK = 1 << 16
+
+HEX_STRINGS = [f"{seed:04X}" for seed in range(seed_engine.SEED_SPACE)]
+
+
+def _format_chunk(chunk_start, seeds, line_format):
+    # Dates change once a day and times/hex strings come from lookup tables,
+    # so the per-row work is a single string format
+    lines = []
+    seeds = seeds.tolist()
+    position = 0
+    while position < len(seeds):
+        minute = chunk_start + position
+        day, minute_of_day = divmod(minute, seed_engine.MINUTES_PER_DAY)
+        date = seed_engine.date_string(day)
+        day_rows = min(seed_engine.MINUTES_PER_DAY - minute_of_day, len(seeds) - position)
+        for i in range(day_rows):
+            lines.append(line_format.format(
+                date, seed_engine.TIME_STRINGS[minute_of_day + i], HEX_STRINGS[seeds[position + i]]))
+        position += day_rows
+    return "".join(lines).encode("ascii")
+
+
+def iter_export_chunks(start, count, fmt, chunk_size=EXPORT_CHUNK, source=seed_engine.seeds_for_range):
+    """Yield (minutes_done, bytes) for a seed range in the given format
+
+    source(start, count) supplies the seeds, e.g. a SeedCache's get.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"format must be one of {', '.join(FORMATS)}")
+    seed_engine.check_range(start, count)
+
+    if fmt == 'csv':
+        yield 0, b"datetime,seed\n"
+        line_format = "{}T{},{}\n"
+    elif fmt == 'jsonl':
+        # The date/time/hex pieces never need escaping
+        line_format = '{{"datetime": "{}T{}", "seed": "{}"}}\n'
+    else:
+        header = np.array([(BIN_MAGIC, start, count)], dtype=BIN_HEADER_DTYPE)
+        yield 0, header.tobytes()
+
+    end = start + count
+    for chunk_start in range(start, end, chunk_size):
+        seeds = source(chunk_start, min(chunk_size, end - chunk_start))
+        done = chunk_start + seeds.size - start
+        if fmt == 'bin':
+            yield done, seeds.astype('<u2', copy=False).tobytes()
+        else:
+            yield done, _format_chunk(chunk_start, seeds, line_format)
+
+
+def write_range(stream, start, count, fmt, chunk_size=EXPORT_CHUNK, source=seed_engine.seeds_for_range):
+    """Write a seed range to a binary stream, one chunk at a time"""
+    for _, data in iter_export_chunks(start, count, fmt, chunk_size, source):
+        stream.write(data)
+
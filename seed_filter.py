@@ -0,0 +1,100 @@
+import re
+
+import numpy as np
+
+# Filter terms, separated by commas or spaces; the result is their union:
+#   05A0          one seed
+#   0000-00FF     an inclusive range
+#   A0*           every seed starting with these hex digits
+TERM_PATTERN = re.compile(r"^([0-9A-Fa-f]{1,4})(?:-([0-9A-Fa-f]{1,4})|(\*))?$")
+
+
+def parse_filter(text):
+    """Sorted, merged list of inclusive (lo, hi) seed ranges, or None when blank"""
+    ranges = []
+    for term in re.split(r"[\s,;]+", text.strip()):
+        if not term:
+            continue
+        match = TERM_PATTERN.match(term)
+        if not match:
+            raise ValueError(f"{term!r} is not a seed, range (0000-00FF) or prefix (A0*)")
+        digits, end, star = match.groups()
+        lo = int(digits, 16)
+        if star:
+            shift = 4 * (4 - len(digits))
+            lo, hi = lo << shift, ((lo + 1) << shift) - 1
+        else:
+            hi = int(end, 16) if end else lo
+        if lo > hi:
+            raise ValueError(f"{term!r}: range is backwards")
+        ranges.append((lo, hi))
+    if not ranges:
+        return None
+    ranges.sort()
+    merged = [ranges[0]]
+    for lo, hi in ranges[1:]:
+        if lo <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], hi))
+        else:
+            merged.append((lo, hi))
+    return merged
+
+
+class SeedView:
+    """Filter and sort a result set of (minute, seed) rows
+
+    Rows are the positions in `seeds`. A generated range has minutes
+    start + row; other results pass their minutes explicitly. The seed order
+    (a stable argsort) is built once and answers every filter with one
+    binary search per range.
+    """
+
+    def __init__(self, seeds, start=None, minutes=None, count=None):
+        self.seeds = seeds
+        self.start = start
+        self.minutes = minutes
+        self.count = len(seeds) if count is None else count
+        self.order = None
+        self.sorted_seeds = None
+
+    @property
+    def in_minute_order(self):
+        # Only generated ranges have strictly increasing minutes by row
+        return self.start is not None
+
+    def set_count(self, count):
+        """Rows loaded so far; the seed order is rebuilt on next use"""
+        if count != self.count:
+            self.count = count
+            self.order = self.sorted_seeds = None
+
+    def minutes_for(self, rows):
+        if self.start is not None:
+            return self.start + np.asarray(rows, dtype=np.int64)
+        return self.minutes[rows]
+
+    def prepare(self):
+        """Build the seed order now, e.g. on a worker thread for big results"""
+        if self.order is None:
+            seeds = self.seeds[:self.count]
+            self.order = np.argsort(seeds, kind='stable')
+            self.sorted_seeds = seeds[self.order]
+        return self.order, self.sorted_seeds
+
+    def select(self, ranges=None, by_seed=False):
+        """Rows passing the filter, in row order or by seed (ties in row order)
+
+        Returns None when neither a filter nor a sort is asked for.
+        """
+        if ranges is None and not by_seed:
+            return None
+        order, sorted_seeds = self.prepare()
+        if ranges is None:
+            return order
+        bounds = np.array(ranges, dtype=np.int64)
+        lo = np.searchsorted(sorted_seeds, bounds[:, 0], side='left')
+        hi = np.searchsorted(sorted_seeds, bounds[:, 1], side='right')
+        rows = np.concatenate([order[a:b] for a, b in zip(lo.tolist(), hi.tolist())])
+        if not by_seed:
+            rows.sort()
+        return rows
@@ -0,0 +1,184 @@
+"""Local JSON seed service: python seed_server.py --port 8765
+
+    GET /seed?datetime=2004-05-06T07:08
+    GET /range?start=2004-05-06T07:08&count=1440     (chunked JSON Lines)
+    GET /reverse?seed=05A0
+
+Runs on one asyncio event loop; engine work is handed to a small thread pool
+so a long range never stalls the other connections. Binds to localhost by
+default.
+"""
+import argparse
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import json
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+import reverse_index
+import seed_engine
+from seed_cache import SeedCache, BLOCK_MINUTES
+import seed_export
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+
+# Minutes per streamed /range chunk, one cache block each
+RANGE_CHUNK = BLOCK_MINUTES
+
+# Request line plus headers; anything longer is rejected
+MAX_HEADER_BYTES = 16384
+
+REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed', 500: 'Internal Server Error'}
+
+
+class RequestError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def _param(query, name):
+    values = query.get(name)
+    if not values:
+        raise RequestError(400, f"missing parameter: {name}")
+    return values[0]
+
+
+def _minute_param(query, name):
+    text = _param(query, name)
+    try:
+        return seed_engine.minute_index(datetime.fromisoformat(text))
+    except ValueError as e:
+        raise RequestError(400, f"{name}: {e}")
+
+
+class SeedServer:
+    """HTTP/1.1 handlers over a shared SeedCache"""
+
+    def __init__(self, cache=None, workers=4):
+        self.cache = cache or SeedCache()
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.index_lock = asyncio.Lock()
+
+    async def _run(self, func, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+
+    async def handle(self, reader, writer):
+        try:
+            try:
+                head = await reader.readuntil(b"\r\n\r\n")
+            except asyncio.LimitOverrunError:
+                await self._send_json(writer, 400, {'error': "request headers too large"})
+                return
+            except asyncio.IncompleteReadError:
+                return
+            try:
+                method, target = self._request_line(head)
+                if method != 'GET':
+                    raise RequestError(405, "only GET is supported")
+                url = urlsplit(target)
+                query = parse_qs(url.query)
+                if url.path == '/seed':
+                    await self._send_json(writer, 200, self.seed(query))
+                elif url.path == '/range':
+                    await self.range(writer, query)
+                elif url.path == '/reverse':
+                    await self._send_json(writer, 200, await self.reverse(query))
+                else:
+                    raise RequestError(404, f"no such endpoint: {url.path}")
+            except RequestError as e:
+                await self._send_json(writer, e.status, {'error': str(e)})
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    def _request_line(self, head):
+        try:
+            method, target, _ = head.split(b"\r\n", 1)[0].decode("ascii").split(" ", 2)
+        except (UnicodeDecodeError, ValueError):
+            raise RequestError(400, "malformed request line")
+        return method, target
+
+    def _headers(self, status, content_type, extra=()):
+        lines = [f"HTTP/1.1 {status} {REASONS[status]}", f"Content-Type: {content_type}", "Connection: close", *extra]
+        return ("\r\n".join(lines) + "\r\n\r\n").encode("ascii")
+
+    async def _send_json(self, writer, status, body):
+        data = json.dumps(body).encode("utf-8")
+        writer.write(self._headers(status, "application/json", [f"Content-Length: {len(data)}"]) + data)
+        await writer.drain()
+
+    def seed(self, query):
+        minute = _minute_param(query, 'datetime')
+        date, time = seed_engine.format_minute(minute)
+        seed = int(self.cache.get(minute, 1)[0])
+        return {'datetime': f"{date}T{time}", 'seed': f"{seed:04X}"}
+
+    async def range(self, writer, query):
+        start = _minute_param(query, 'start')
+        try:
+            count = int(_param(query, 'count'))
+            seed_engine.check_range(start, count)
+        except ValueError as e:
+            raise RequestError(400, f"count: {e}")
+
+        chunks = seed_export.iter_export_chunks(start, count, 'jsonl', RANGE_CHUNK, source=self.cache.get)
+        writer.write(self._headers(200, "application/x-ndjson", ["Transfer-Encoding: chunked"]))
+        try:
+            while True:
+                # Formatting runs off the loop; drain() holds back fast
+                # producers when the client reads slowly
+                item = await self._run(next, chunks, None)
+                if item is None:
+                    break
+                data = item[1]
+                writer.write(f"{len(data):X}\r\n".encode("ascii") + data + b"\r\n")
+                await writer.drain()
+            writer.write(b"0\r\n\r\n")
+            await writer.drain()
+        finally:
+            chunks.close()
+
+    async def reverse(self, query):
+        try:
+            seed = int(_param(query, 'seed'), 16)
+            if not (0 <= seed < seed_engine.SEED_SPACE):
+                raise ValueError("seed must be between 0000 and FFFF")
+        except ValueError as e:
+            raise RequestError(400, f"seed: {e}")
+        # The first lookup may have to build the index; later ones wait for it
+        async with self.index_lock:
+            try:
+                index = await self._run(reverse_index.open_index)
+            except OSError as e:
+                raise RequestError(500, f"reverse index unavailable: {e}")
+        minutes = index.minutes_for_seed(seed).tolist()
+        datetimes = ["{}T{}".format(*seed_engine.format_minute(minute)) for minute in minutes]
+        return {'seed': f"{seed:04X}", 'count': len(datetimes), 'datetimes': datetimes}
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, cache=None):
+    handler = SeedServer(cache)
+    server = await asyncio.start_server(handler.handle, host, port, limit=MAX_HEADER_BYTES)
+    print(f"Serving seeds on http://{host}:{port}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve Ruby/Sapphire live battery seeds as JSON over HTTP")
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
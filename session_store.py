@@ -0,0 +1,200 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+
+import numpy as np
+
+import seed_engine
+
+# Past queries and their results, kept between launches
+STORE_PATH = os.path.join(seed_engine.DATA_DIR, "sessions.sqlite3")
+
+SCHEMA_VERSION = 1
+
+# Query kinds: a generated minute range, a reverse lookup of one seed, and a
+# target (RNG) search
+KINDS = ('range', 'reverse', 'target')
+
+# Saves that arrive within this many seconds share one transaction
+FLUSH_SECONDS = 1.0
+
+# Queries kept per kind; the least recently used go first
+HISTORY_LIMIT = 200
+
+# Only the most recently used queries of each kind keep their results, and
+# only up to this size; older and bigger ones keep just their inputs
+RESULT_LIMIT = 10
+MAX_RESULT_BYTES = 1 << 22
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS queries (
+    id INTEGER PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    created REAL NOT NULL,
+    used REAL NOT NULL,
+    first_minute INTEGER,
+    end_minute INTEGER,
+    row_count INTEGER NOT NULL,
+    UNIQUE (kind, params)
+);
+CREATE INDEX IF NOT EXISTS queries_used ON queries (kind, used);
+CREATE INDEX IF NOT EXISTS queries_minutes ON queries (first_minute, end_minute);
+CREATE TABLE IF NOT EXISTS results (
+    query_id INTEGER NOT NULL REFERENCES queries (id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    dtype TEXT NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (query_id, name)
+);
+CREATE TABLE IF NOT EXISTS query_seeds (
+    seed INTEGER NOT NULL,
+    query_id INTEGER NOT NULL REFERENCES queries (id) ON DELETE CASCADE,
+    PRIMARY KEY (seed, query_id)
+) WITHOUT ROWID;
+"""
+
+
+def params_key(params):
+    # Canonical JSON, so the same inputs always find the same row
+    return json.dumps(params, sort_keys=True, separators=(',', ':'))
+
+
+def _pack(array):
+    array = np.ascontiguousarray(array)
+    return json.dumps(np.lib.format.dtype_to_descr(array.dtype)), array.tobytes()
+
+
+def _unpack(descr, data):
+    return np.frombuffer(data, dtype=np.lib.format.descr_to_dtype(json.loads(descr)))
+
+
+class SessionStore:
+    """SQLite store of past queries and their results
+
+    A query is its kind plus a dict of inputs; its results are named NumPy
+    arrays kept as packed little-endian blobs (seeds as uint16). Queries are
+    indexed by the minute span they cover and by the seeds in their results.
+    Saves are buffered and written together in one transaction, at most
+    FLUSH_SECONDS later. Safe to share between threads.
+    """
+
+    def __init__(self, path=STORE_PATH):
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute("PRAGMA foreign_keys=ON")
+        version = self.db.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, SCHEMA_VERSION):
+            raise ValueError(f"{path} was written by a newer version (schema {version})")
+        self.db.executescript(SCHEMA)
+        self.db.execute(f"PRAGMA user_version={SCHEMA_VERSION}")
+        self.lock = threading.Lock()
+        self.pending = []
+        self.timer = None
+
+    def save(self, kind, params, arrays, first_minute=None, end_minute=None, seeds=None, row_count=None):
+        """Queue a query and its result arrays; returns immediately
+
+        `seeds` are the seeds the result is indexed under (e.g. the distinct
+        hit seeds); row_count defaults to the length of the first array.
+        """
+        if kind not in KINDS:
+            raise ValueError(f"kind must be one of {', '.join(KINDS)}")
+        if row_count is None:
+            row_count = len(next(iter(arrays.values()))) if arrays else 0
+        if sum(np.asarray(array).nbytes for array in arrays.values()) > MAX_RESULT_BYTES:
+            arrays = {}
+        packed = {name: _pack(array) for name, array in arrays.items()}
+        seeds = [] if seeds is None else np.unique(np.asarray(seeds, dtype=np.int64)).tolist()
+        with self.lock:
+            self.pending.append((kind, params_key(params), time.time(), first_minute, end_minute,
+                                 row_count, packed, seeds))
+            if self.timer is None:
+                self.timer = threading.Timer(FLUSH_SECONDS, self.flush)
+                self.timer.daemon = True
+                self.timer.start()
+
+    def flush(self):
+        """Write every queued save in one transaction"""
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+            pending, self.pending = self.pending, []
+            if not pending:
+                return
+            with self.db:
+                for kind, key, now, first_minute, end_minute, row_count, packed, seeds in pending:
+                    query_id = self.db.execute(
+                        "INSERT INTO queries (kind, params, created, used, first_minute, end_minute, row_count)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?)"
+                        " ON CONFLICT (kind, params) DO UPDATE SET used = excluded.used,"
+                        " first_minute = excluded.first_minute, end_minute = excluded.end_minute,"
+                        " row_count = excluded.row_count"
+                        " RETURNING id",
+                        (kind, key, now, now, first_minute, end_minute, row_count)).fetchone()[0]
+                    self.db.execute("DELETE FROM results WHERE query_id = ?", (query_id,))
+                    self.db.executemany("INSERT INTO results VALUES (?, ?, ?, ?)",
+                                        [(query_id, name, descr, data) for name, (descr, data) in packed.items()])
+                    self.db.execute("DELETE FROM query_seeds WHERE query_id = ?", (query_id,))
+                    self.db.executemany("INSERT INTO query_seeds VALUES (?, ?)",
+                                        [(seed, query_id) for seed in seeds])
+                for kind in {item[0] for item in pending}:
+                    self.db.execute(
+                        "DELETE FROM queries WHERE kind = ? AND id NOT IN"
+                        " (SELECT id FROM queries WHERE kind = ? ORDER BY used DESC LIMIT ?)",
+                        (kind, kind, HISTORY_LIMIT))
+                    self.db.execute(
+                        "DELETE FROM results WHERE query_id IN"
+                        " (SELECT id FROM queries WHERE kind = ? ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                        (kind, RESULT_LIMIT))
+
+    def find(self, kind, params):
+        """Id of a stored query with exactly these inputs, or None; marks it used"""
+        self.flush()
+        with self.lock:
+            with self.db:
+                row = self.db.execute("UPDATE queries SET used = ? WHERE kind = ? AND params = ? RETURNING id",
+                                      (time.time(), kind, params_key(params))).fetchone()
+        return None if row is None else row[0]
+
+    def load(self, query_id):
+        """{name: array} of a stored query's results; empty when only the inputs were kept"""
+        with self.lock:
+            rows = self.db.execute("SELECT name, dtype, data FROM results WHERE query_id = ?",
+                                   (query_id,)).fetchall()
+        return {name: _unpack(descr, data) for name, descr, data in rows}
+
+    def _queries(self, where, args, limit):
+        self.flush()
+        with self.lock:
+            rows = self.db.execute(
+                "SELECT id, kind, params, created, used, first_minute, end_minute, row_count FROM queries"
+                f" WHERE {where} ORDER BY used DESC LIMIT ?", (*args, limit)).fetchall()
+        return [{'id': query_id, 'kind': kind, 'params': json.loads(params), 'created': created, 'used': used,
+                 'first_minute': first_minute, 'end_minute': end_minute, 'row_count': row_count}
+                for query_id, kind, params, created, used, first_minute, end_minute, row_count in rows]
+
+    def history(self, kind=None, limit=HISTORY_LIMIT):
+        """Stored queries, most recently used first"""
+        if kind is None:
+            return self._queries("1", (), limit)
+        return self._queries("kind = ?", (kind,), limit)
+
+    def queries_for_seed(self, seed, limit=HISTORY_LIMIT):
+        """Queries whose results are indexed under a seed"""
+        return self._queries("id IN (SELECT query_id FROM query_seeds WHERE seed = ?)", (seed,), limit)
+
+    def queries_covering(self, minute, limit=HISTORY_LIMIT):
+        """Queries whose minute span contains a minute index"""
+        return self._queries("first_minute <= ? AND end_minute > ?", (minute, minute), limit)
+
+    def close(self):
+        self.flush()
+        with self.lock:
+            self.db.close()
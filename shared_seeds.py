@@ -0,0 +1,149 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import ctypes
+from multiprocessing import shared_memory
+import os
+
+import numpy as np
+
+import seed_engine
+
+# Minutes per worker task (a few MB of seeds each)
+TASK_MINUTES = seed_engine.DAYS_PER_CHUNK * seed_engine.MINUTES_PER_DAY
+
+# Shorter ranges are cheaper to compute in-process than to start a pool for
+PARALLEL_MIN_MINUTES = 1 << 23
+
+# Blocks whose arrays were still in use when released; close_released()
+# retries them
+_lingering = []
+
+
+class SharedSeeds:
+    """Seeds for a minute range in one shared-memory block
+
+    Worker processes attach by name and write their slices in place, so the
+    parent never copies or concatenates chunks. `seeds` is a plain uint16
+    array over the block; export, analytics and the results table read it
+    directly, and `get` makes it a drop-in seed source for a sub-range.
+    """
+
+    def __init__(self, start, count, name=None):
+        seed_engine.check_range(start, count)
+        self.start = start
+        self.count = count
+        self.owner = name is None
+        size = max(count, 1) * np.dtype(seed_engine.SEED_DTYPE).itemsize
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size)
+        # NumPy doesn't hold a buffer export on a memoryview base, so the
+        # array sits on a ctypes view that does: while any array over the
+        # block lives, closing it fails instead of leaving the array dangling
+        view = (ctypes.c_uint16 * count).from_buffer(self.shm.buf)
+        self.seeds = np.frombuffer(view, dtype=seed_engine.SEED_DTYPE)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def covers(self, start, count):
+        return self.start <= start and start + count <= self.start + self.count
+
+    def get(self, start, count, out=None):
+        """Seeds for `count` minutes from `start`; a view unless `out` is given"""
+        if not self.covers(start, count):
+            raise ValueError("minute range is outside the shared block")
+        seeds = self.seeds[start - self.start:start - self.start + count]
+        if out is None:
+            return seeds
+        out[:] = seeds
+        return out
+
+    def release(self):
+        """Drop this process's mapping (and the block itself, for the creator)
+
+        Arrays taken from `seeds` keep the mapping alive until they go away.
+        """
+        if self.seeds is None:
+            return
+        self.seeds = None
+        if self.owner:
+            try:
+                self.shm.unlink()
+            except FileNotFoundError:
+                pass
+        _lingering.append(self.shm)
+        close_released()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def close_released():
+    """Close released blocks whose last arrays have gone since"""
+    for shm in list(_lingering):
+        try:
+            shm.close()
+        except BufferError:
+            continue
+        _lingering.remove(shm)
+
+
+def worth_parallel(count):
+    """Whether a range is long enough, and the machine wide enough, for the pool"""
+    return count >= PARALLEL_MIN_MINUTES and (os.cpu_count() or 1) > 1
+
+
+def _fill(name, start, count, offset, size):
+    # Worker side: attach to the parent's block and write one slice
+    shared = SharedSeeds(start, count, name=name)
+    try:
+        seed_engine.seeds_for_range(start + offset, size, out=shared.seeds[offset:offset + size])
+    finally:
+        shared.release()
+    return offset, size
+
+
+def iter_fill(shared, first=0, workers=None, task_minutes=TASK_MINUTES):
+    """Fill shared.seeds[first:] across a process pool
+
+    Yields (fraction done, ready) as tasks finish, where `ready` is how many
+    leading minutes are complete, so a consumer can use the front of the
+    block while the rest is still being written. Closing the generator early
+    cancels the tasks that have not started yet.
+    """
+    remaining = shared.count - first
+    if remaining <= 0:
+        yield 1.0, shared.count
+        return
+    tasks = range(first, shared.count, task_minutes)
+    executor = ProcessPoolExecutor(max_workers=workers or os.cpu_count())
+    try:
+        futures = [executor.submit(_fill, shared.name, shared.start, shared.count,
+                                   offset, min(task_minutes, shared.count - offset))
+                   for offset in tasks]
+        finished = {}
+        ready = first
+        done = 0
+        for future in as_completed(futures):
+            offset, size = future.result()
+            finished[offset] = size
+            done += size
+            while ready in finished:
+                ready += finished.pop(ready)
+            yield done / remaining, ready
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def generate(start, count, workers=None):
+    """SharedSeeds for a minute range, filled in parallel; release() when done"""
+    shared = SharedSeeds(start, count)
+    try:
+        for _ in iter_fill(shared, workers=workers):
+            pass
+    except BaseException:
+        shared.release()
+        raise
+    return shared
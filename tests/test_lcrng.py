@@ -0,0 +1,39 @@
+import numpy as np
+
+import lcrng
+
+
+def step(state, frames):
+    for _ in range(frames):
+        state = lcrng.next_state(state)
+    return state
+
+
+def test_jump_matches_stepping():
+    for seed in (0, 1, 0x1234, 0xFFFF, 0xDEADBEEF):
+        for frames in (0, 1, 2, 3, 31, 32, 100, 1023, 4097):
+            assert lcrng.jump(seed, frames) == step(seed, frames)
+
+
+def test_jump_wraps_at_period():
+    assert lcrng.jump(0x1234, lcrng.PERIOD) == 0x1234
+    assert lcrng.jump(0x1234, lcrng.PERIOD + 5) == step(0x1234, 5)
+
+
+def test_jump_array_matches_jump():
+    rng = np.random.default_rng(3)
+    seeds = rng.integers(0, 1 << 32, 64, dtype=np.uint64)
+    frames = rng.integers(0, 1 << 20, 64, dtype=np.uint64)
+    jumped = lcrng.jump_array(seeds, frames)
+    assert jumped.dtype == np.uint32
+    assert jumped.tolist() == [lcrng.jump(int(s), int(f)) for s, f in zip(seeds, frames)]
+    # One count for every state
+    assert lcrng.jump_array(seeds, 777).tolist() == [lcrng.jump(int(s), 777) for s in seeds]
+
+
+def test_states_window_matches_stepping():
+    seeds = [0, 0x1234, 0xFFFF]
+    window = lcrng.states_window(seeds, 50)
+    assert window.shape == (50, 3)
+    for lane, seed in enumerate(seeds):
+        assert window[:, lane].tolist() == [step(seed, i) for i in range(50)]
@@ -0,0 +1,103 @@
+import numpy as np
+
+import lcrng
+import rng_search
+
+SEEDS = (0, 0x1234, 0x5A5A, 0xFFFF)
+
+
+def brute_force(seeds, criteria):
+    # One frame at a time, straight from the Method 1 definition
+    found = []
+    for seed in seeds:
+        state = lcrng.jump(seed, criteria['min_frame'])
+        for frame in range(criteria['min_frame'], criteria['max_frame'] + 1):
+            calls = []
+            s = state
+            for _ in range(4):
+                s = lcrng.next_state(s)
+                calls.append(lcrng.rand(s))
+            low, high, iv1, iv2 = calls
+            pid = (high << 16) | low
+            values = {'HP': iv1 & 31, 'Atk': (iv1 >> 5) & 31, 'Def': (iv1 >> 10) & 31,
+                      'Spe': iv2 & 31, 'SpA': (iv2 >> 5) & 31, 'SpD': (iv2 >> 10) & 31}
+            ok = all(criteria['iv_min'][stat] <= values[stat] <= criteria['iv_max'][stat] for stat in rng_search.STATS)
+            if criteria['natures'] is not None:
+                ok = ok and pid % 25 in criteria['natures']
+            if criteria['shiny'] is not None:
+                ok = ok and (criteria['shiny'] ^ low ^ high) < 8
+            if ok:
+                found.append((seed, frame, pid, iv1, iv2))
+            state = lcrng.next_state(state)
+    return sorted(found)
+
+
+def search(seeds, criteria):
+    hits = np.concatenate([rng_search.search_seeds(seed, seed + 1, criteria) for seed in seeds])
+    return sorted(map(tuple, hits.tolist()))
+
+
+def test_every_frame_is_a_hit_without_filters():
+    criteria = rng_search.make_criteria(40, min_frame=5)
+    assert search(SEEDS, criteria) == brute_force(SEEDS, criteria)
+    assert len(search(SEEDS, criteria)) == len(SEEDS) * 36
+
+
+def test_iv_and_nature_filters_match_brute_force():
+    criteria = rng_search.make_criteria(3000, iv_min={'HP': 20, 'Spe': 10}, iv_max={'Atk': 15},
+                                        natures=['Timid', 'Modest'])
+    expected = brute_force(SEEDS, criteria)
+    assert expected
+    assert search(SEEDS, criteria) == expected
+
+
+def test_shiny_check_matches_brute_force():
+    # TID/SID picked so that frame 50 of seed 0x1234 is shiny
+    state = lcrng.jump(0x1234, 51)
+    low = lcrng.rand(state)
+    high = lcrng.rand(lcrng.next_state(state))
+    criteria = rng_search.make_criteria(5000, tid=low ^ high, sid=0)
+    expected = brute_force(SEEDS, criteria)
+    assert (0x1234, 50) in [hit[:2] for hit in expected]
+    assert search(SEEDS, criteria) == expected
+
+
+def test_ivs_decodes_both_words():
+    iv1 = 31 | (0 << 5) | (17 << 10)
+    iv2 = 3 | (30 << 5) | (9 << 10)
+    assert rng_search.ivs(iv1, iv2) == {'HP': 31, 'Atk': 0, 'Def': 17, 'Spe': 3, 'SpA': 30, 'SpD': 9}
+
+
+def test_limit_keeps_the_first_hits_by_frame():
+    criteria = rng_search.make_criteria(3000, natures=['Adamant'])
+    everything = rng_search.search_seeds(0, 64, criteria, limit=None)
+    first = rng_search.search_seeds(0, 64, criteria, limit=100)
+    assert first.tolist() == np.sort(everything, order=('frame', 'seed'))[:100].tolist()
+
+
+class FakeIndex:
+    # Minutes for each seed, ascending, like reverse_index.SeedIndex
+    def __init__(self, seeds):
+        self.seeds = np.asarray(seeds)
+
+    def minutes_for_seed(self, seed):
+        return np.flatnonzero(self.seeds == seed)
+
+
+def test_rank_clock_settings_joins_every_minute_of_every_hit():
+    rng = np.random.default_rng(7)
+    index = FakeIndex(rng.integers(0, 8, 500))
+    hits = np.zeros(6, dtype=rng_search.HIT_DTYPE)
+    hits['seed'] = [3, 5, 3, 7, 9, 5]
+    hits['frame'] = [10, 4, 2, 10, 1, 4]
+    minutes, hit_rows = rng_search.rank_clock_settings(hits, index, 50, 400)
+
+    expected = sorted((int(hits['frame'][row]), int(minute), row)
+                      for row, seed in enumerate(hits['seed'])
+                      for minute in index.minutes_for_seed(seed) if 50 <= minute < 400)
+    got = [(int(hits['frame'][row]), int(minute), int(row)) for minute, row in zip(minutes, hit_rows)]
+    assert sorted(got) == expected
+    # Ranked by frame, then minute
+    assert [item[:2] for item in got] == [item[:2] for item in expected]
+    empty = rng_search.rank_clock_settings(hits[:0], index)
+    assert empty[0].size == empty[1].size == 0
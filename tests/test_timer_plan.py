@@ -0,0 +1,34 @@
+import sys
+import time
+
+import timer_plan
+
+
+def test_overlapping_countdowns_restore_the_switch_interval():
+    before = sys.getswitchinterval()
+    first = timer_plan.Countdown([30, 30]).start()
+    time.sleep(0.01)
+    second = timer_plan.Countdown([100]).start()
+    first.thread.join()
+    # The second countdown still needs the lowered interval
+    assert sys.getswitchinterval() == min(before, timer_plan.Countdown.SWITCH_INTERVAL)
+    second.thread.join()
+    assert sys.getswitchinterval() == before
+    assert len(first.late_ns) == 2 and len(second.late_ns) == 1
+
+
+def test_cancelled_countdown_restores_the_switch_interval():
+    before = sys.getswitchinterval()
+    countdown = timer_plan.Countdown([5000]).start()
+    countdown.cancel()
+    countdown.thread.join()
+    assert sys.getswitchinterval() == before
+    assert countdown.late_ns == []
+
+
+def test_plan_converts_frames_at_the_gba_rate():
+    plans = timer_plan.plan(timer_plan.parse_frames("0, 60, 1500-1501"), lead_seconds=5, calibration_frames=2)
+    assert plans['frame'].tolist() == [0, 60, 1500, 1501]
+    assert plans['lead_ms'].tolist() == [5000.0] * 4
+    assert abs(plans['target_ms'][1] - 62 * 1000 * 280896 / (1 << 24)) < 1e-9
+    assert (plans['total_ms'] == plans['lead_ms'] + plans['target_ms']).all()
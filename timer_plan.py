@@ -0,0 +1,172 @@
+import re
+import sys
+import threading
+import time
+
+import numpy as np
+
+# The GBA draws a frame every 280,896 cycles of its 2^24 Hz clock
+CYCLES_PER_SECOND = 1 << 24
+CYCLES_PER_FRAME = 280896
+FRAME_RATE = CYCLES_PER_SECOND / CYCLES_PER_FRAME    # ~59.7275 fps
+FRAME_MS = 1000 / FRAME_RATE
+
+# Seconds between starting the timer and resetting the console
+DEFAULT_LEAD_SECONDS = 5
+
+# Frame lists are written like "1200, 1500-1510"; bigger lists are refused
+FRAME_TERM = re.compile(r"^(\d+)(?:-(\d+))?$")
+MAX_PLAN_FRAMES = 1 << 20
+
+# Countdowns running now, and the switch interval to put back once none are;
+# the setting is process-wide, so overlapping countdowns share one change
+_switch_lock = threading.Lock()
+_switch_users = 0
+_saved_switch_interval = None
+
+
+def _lower_switch_interval(interval):
+    global _switch_users, _saved_switch_interval
+    with _switch_lock:
+        if _switch_users == 0:
+            _saved_switch_interval = sys.getswitchinterval()
+            sys.setswitchinterval(min(_saved_switch_interval, interval))
+        _switch_users += 1
+
+
+def _restore_switch_interval():
+    global _switch_users
+    with _switch_lock:
+        _switch_users -= 1
+        if _switch_users == 0:
+            sys.setswitchinterval(_saved_switch_interval)
+
+
+# A plan has two phases: the lead, ending with the reset, then the wait from
+# the reset until the A press that lands on the target frame
+PLAN_DTYPE = np.dtype([('frame', '<i8'), ('lead_ms', '<f8'), ('target_ms', '<f8'), ('total_ms', '<f8')])
+
+
+def parse_frames(text):
+    """Sorted unique target frames from e.g. '1200, 1500-1510'"""
+    parts = []
+    for term in re.split(r"[\s,;]+", text.strip()):
+        if not term:
+            continue
+        match = FRAME_TERM.match(term)
+        if not match:
+            raise ValueError(f"{term!r} is not a frame or a range of frames (1500-1510)")
+        lo = int(match.group(1))
+        hi = int(match.group(2) or lo)
+        if lo > hi:
+            raise ValueError(f"{term!r}: range is backwards")
+        if hi - lo >= MAX_PLAN_FRAMES:
+            raise ValueError(f"at most {MAX_PLAN_FRAMES:,} frames at a time")
+        parts.append(np.arange(lo, hi + 1, dtype=np.int64))
+    if not parts:
+        raise ValueError("enter at least one target frame")
+    frames = np.unique(np.concatenate(parts))
+    if frames.size > MAX_PLAN_FRAMES:
+        raise ValueError(f"at most {MAX_PLAN_FRAMES:,} frames at a time")
+    return frames
+
+
+def frames_to_ms(frames):
+    return np.asarray(frames, dtype=np.float64) * FRAME_MS
+
+
+def plan(frames, lead_seconds=DEFAULT_LEAD_SECONDS, calibration_frames=0):
+    """PLAN_DTYPE rows for any number of target frames at once
+
+    calibration_frames shifts every press to make up for the frames lost
+    between pressing and the game reading the input; it is found by trial.
+    """
+    frames = np.asarray(frames, dtype=np.int64)
+    plans = np.empty(frames.shape, dtype=PLAN_DTYPE)
+    plans['frame'] = frames
+    plans['lead_ms'] = lead_seconds * 1000
+    plans['target_ms'] = frames_to_ms(frames + calibration_frames)
+    if (plans['target_ms'] < 0).any():
+        raise ValueError("calibration moves a press before the reset")
+    plans['total_ms'] = plans['lead_ms'] + plans['target_ms']
+    return plans
+
+
+def format_ms(ms):
+    """Milliseconds as m:ss.mmm"""
+    minutes, seconds = divmod(float(ms) / 1000, 60)
+    return f"{int(minutes)}:{seconds:06.3f}"
+
+
+class Countdown:
+    """Time a plan's phases on a worker thread with perf_counter_ns
+
+    The thread sleeps until shortly before each phase ends, then spins on the
+    clock, so the cue is not held up by the Tk loop repainting. on_cue(phase,
+    late_ns) runs on that thread at the end of every phase; late_ns, how far
+    past its deadline the cue fired, is also kept in `late_ns`. A display
+    polls status() rather than being called from the thread.
+    """
+
+    # Sleeps on Windows can overshoot by a timer tick (~15.6 ms), so the
+    # last stretch before a deadline is spun instead
+    SPIN_NS = 20_000_000
+
+    # While a countdown runs, threads hand over the GIL this often (seconds)
+    # instead of every 5 ms, so a busy UI thread can't hold the cue back
+    # by a third of a frame
+    SWITCH_INTERVAL = 0.0005
+
+    def __init__(self, phases_ms, on_cue=None):
+        self.phases_ns = [int(round(ms * 1_000_000)) for ms in phases_ms]
+        self.on_cue = on_cue
+        self.deadlines = []
+        self.late_ns = []
+        self.cancelled = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        deadline = time.perf_counter_ns()
+        for phase_ns in self.phases_ns:
+            deadline += phase_ns
+            self.deadlines.append(deadline)
+        self.thread.start()
+        return self
+
+    def cancel(self):
+        self.cancelled.set()
+
+    @property
+    def running(self):
+        return self.thread.is_alive()
+
+    def status(self):
+        """(phase index, ns left in it), or None once the last phase is over"""
+        now = time.perf_counter_ns()
+        for phase, deadline in enumerate(self.deadlines):
+            if now < deadline:
+                return phase, deadline - now
+        return None
+
+    def _run(self):
+        _lower_switch_interval(self.SWITCH_INTERVAL)
+        try:
+            for phase, deadline in enumerate(self.deadlines):
+                while True:
+                    remaining = deadline - time.perf_counter_ns()
+                    if remaining <= 0:
+                        break
+                    if remaining > self.SPIN_NS:
+                        if self.cancelled.wait((remaining - self.SPIN_NS) / 1e9):
+                            return
+                    else:
+                        if self.cancelled.is_set():
+                            return
+                        # Let the UI thread have the GIL between checks
+                        time.sleep(0)
+                late = time.perf_counter_ns() - deadline
+                self.late_ns.append(late)
+                if self.on_cue is not None:
+                    self.on_cue(phase, late)
+        finally:
+            _restore_switch_interval()
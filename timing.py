@@ -0,0 +1,128 @@
+from contextlib import contextmanager
+import cProfile
+from datetime import datetime
+import functools
+import json
+import os
+import threading
+import time
+
+# Opt-in outputs, set through configure(): a JSONL file that gets one record
+# per run, and a directory that gets one .prof file per run
+trace_path = None
+profile_dir = None
+
+# Run that timed() decorators record into
+current = None
+
+
+def configure(trace=None, profile=None):
+    global trace_path, profile_dir
+    trace_path = trace
+    profile_dir = profile
+    if profile_dir:
+        os.makedirs(profile_dir, exist_ok=True)
+
+
+class Run:
+    """Wall-clock time per phase (parse, compute, render, ...) for one run
+
+    Phases may be entered from the UI thread and from a worker thread. When
+    profiling is on, each thread gets its own profiler while inside a phase
+    and the stats are merged when the run finishes.
+    """
+
+    def __init__(self, label, started=None):
+        self.label = label
+        self.started = time.perf_counter() if started is None else started
+        self.phases = {}
+        self.profilers = {}
+        self.record = None
+
+    @contextmanager
+    def phase(self, name):
+        profiler = None
+        if profile_dir:
+            ident = threading.get_ident()
+            profiler = self.profilers.get(ident) or cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                # Python 3.12+ allows only one active profiler at a time.
+                # Only profilers that ran are kept: pstats can't read an
+                # empty one.
+                profiler = None
+            else:
+                self.profilers[ident] = profiler
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+            if profiler is not None:
+                profiler.disable()
+
+    def add_phase(self, name, seconds):
+        """Count time measured outside phase() toward `name`"""
+        self.phases[name] = self.phases.get(name, 0.0) + seconds
+
+    def iter_phase(self, name, iterable):
+        """Iterate, counting the time spent producing each item toward `name`"""
+        iterator = iter(iterable)
+        while True:
+            with self.phase(name):
+                item = next(iterator, StopIteration)
+            if item is StopIteration:
+                return
+            yield item
+
+    def finish(self):
+        """Close the run; writes the trace record and profile if enabled"""
+        global current
+        if current is self:
+            current = None
+        if self.record is not None:
+            return self.record
+        self.record = {
+            'label': self.label,
+            'timestamp': datetime.now().isoformat(timespec='milliseconds'),
+            'phases': self.phases,
+            'total': time.perf_counter() - self.started,
+        }
+        if trace_path:
+            with open(trace_path, "a") as f:
+                f.write(json.dumps(self.record) + "\n")
+        if profile_dir and self.profilers:
+            # Only needed when profiling, and slow to import
+            import pstats
+            stats = None
+            for profiler in self.profilers.values():
+                stats = pstats.Stats(profiler) if stats is None else stats.add(profiler)
+            name = f"{self.label}-{datetime.now():%Y%m%d-%H%M%S-%f}.prof"
+            stats.dump_stats(os.path.join(profile_dir, name))
+        return self.record
+
+    def summary(self):
+        parts = [f"{name} {seconds * 1000:.1f} ms" for name, seconds in self.phases.items()]
+        total = self.record['total'] if self.record else time.perf_counter() - self.started
+        parts.append(f"total {total * 1000:.1f} ms")
+        return f"{self.label}: " + " · ".join(parts)
+
+
+def start_run(label, started=None):
+    global current
+    current = Run(label, started)
+    return current
+
+
+def timed(name):
+    """Decorator: count calls toward phase `name` of the current run"""
+    def decorate(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if current is None:
+                return func(*args, **kwargs)
+            with current.phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
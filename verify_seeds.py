@@ -0,0 +1,210 @@
+"""Differential check of every seed implementation over the whole clock range
+
+    python verify_seeds.py
+    python verify_seeds.py --write-golden golden_seeds.npz
+    python verify_seeds.py --check-golden golden_seeds.npz
+
+Each implementation's formula is re-evaluated with NumPy, minute for minute,
+and compared with seed_engine:
+
+    date.py         hour/minute entry text parsed with int(x, 16); the seed is
+                    shown with hex(), so without leading zeros
+    beta_date.py, gamma_date.py, delta_date.py (before seed_engine)
+                    one shared formula: int(strftime("%H"), 16) etc.
+    seed_engine     day-counter and hex-minute tables
+
+Disagreements are reported as contiguous minute intervals. The golden table
+is the engine's seeds for the whole range, delta-encoded and compressed.
+"""
+import argparse
+from datetime import datetime
+import random
+import sys
+import time
+
+import numpy as np
+
+import seed_engine
+
+GOLDEN_FORMAT = 1
+
+# Days per evaluation chunk
+VERIFY_DAYS = seed_engine.DAYS_PER_CHUNK
+
+# Minutes spot-checked against the original per-row loop
+SPOT_CHECKS = 2000
+
+# Intervals printed per report line before summarising
+MAX_PRINTED = 20
+
+LEGACY_REFERENCE = np.datetime64('1999-12-31', 'D')
+EPOCH_DAY = np.datetime64(seed_engine.EPOCH.date(), 'D')
+
+
+def _clock_hex(minutes_of_day):
+    # "%H" / "%M" text read back as hex: 23 -> 0x23
+    hours, minutes = np.divmod(minutes_of_day, 60)
+    return 60 * ((hours // 10) * 16 + hours % 10) + (minutes // 10) * 16 + minutes % 10
+
+
+def _legacy_days(first_day, days):
+    # (date - datetime(1999, 12, 31)).days, minus 366 when date.year > 2000
+    dates = EPOCH_DAY + np.arange(first_day, first_day + days)
+    difference = (dates - LEGACY_REFERENCE).astype(np.int64)
+    years = dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    return np.where(years > 2000, difference - 366, difference)
+
+
+def legacy_seeds(first_day, days):
+    """beta_date / gamma_date / original delta_date, for whole days"""
+    clock = _clock_hex(np.arange(seed_engine.MINUTES_PER_DAY, dtype=np.int64))
+    total = 24 * 60 * _legacy_days(first_day, days)[:, None] + clock[None, :]
+    return ((total >> 16) ^ (total & 0xFFFF)).ravel()
+
+
+def date_py_seeds(first_day, days):
+    """date.py: seeds and whether hex() shows all four digits
+
+    The hour and minute come straight from the entry text; int(x, 16) gives
+    the same value for "7" and "07", so the number matches the shared
+    formula and only the unpadded display can differ.
+    """
+    clock = _clock_hex(np.arange(seed_engine.MINUTES_PER_DAY, dtype=np.int64))
+    total = 24 * 60 * _legacy_days(first_day, days)[:, None] + clock[None, :]
+    seeds = ((total >> 16) ^ (total & 0xFFFF)).ravel()
+    return seeds, seeds >= 0x1000
+
+
+def engine_seeds(first_day, days):
+    return seed_engine.seeds_for_range(first_day * seed_engine.MINUTES_PER_DAY, days * seed_engine.MINUTES_PER_DAY)
+
+
+class Intervals:
+    """Collect the runs of True in a sequence of boolean chunks"""
+
+    def __init__(self):
+        self.runs = []
+
+    def add(self, start, mask):
+        edges = np.flatnonzero(np.diff(np.concatenate(([False], mask, [False])).astype(np.int8)))
+        for lo, hi in zip(edges[0::2].tolist(), edges[1::2].tolist()):
+            lo, hi = start + lo, start + hi
+            if self.runs and self.runs[-1][1] == lo:
+                self.runs[-1] = (self.runs[-1][0], hi)
+            else:
+                self.runs.append((lo, hi))
+
+    @property
+    def minutes(self):
+        return sum(hi - lo for lo, hi in self.runs)
+
+
+def verify(first_day=0, last_day=seed_engine.DAY_COUNT):
+    """{check name: Intervals of disagreeing minutes} over [first_day, last_day)"""
+    checks = {
+        'beta/gamma/delta formula vs seed_engine': Intervals(),
+        'date.py seed vs seed_engine': Intervals(),
+        'date.py display (leading zeros dropped)': Intervals(),
+    }
+    for day in range(first_day, last_day, VERIFY_DAYS):
+        days = min(VERIFY_DAYS, last_day - day)
+        start = day * seed_engine.MINUTES_PER_DAY
+        engine = engine_seeds(day, days)
+        legacy = legacy_seeds(day, days)
+        date_py, full_width = date_py_seeds(day, days)
+        checks['beta/gamma/delta formula vs seed_engine'].add(start, legacy != engine)
+        checks['date.py seed vs seed_engine'].add(start, date_py != engine)
+        checks['date.py display (leading zeros dropped)'].add(start, ~full_width)
+    return checks
+
+
+def spot_check(count=SPOT_CHECKS, seed=0):
+    """Compare legacy_seeds with the original per-row loop at random minutes
+
+    The 2000/2001 boundary days are always included. Returns the minutes
+    that disagree.
+    """
+    from benchmark import per_row_seeds
+    rng = random.Random(seed)
+    boundary = seed_engine.minute_index(datetime(2000, 12, 31))
+    minutes = list(range(boundary, boundary + 2 * seed_engine.MINUTES_PER_DAY, 37))
+    minutes += [rng.randrange(seed_engine.MINUTE_COUNT) for _ in range(count)]
+    bad = []
+    for minute in minutes:
+        day, minute_of_day = divmod(minute, seed_engine.MINUTES_PER_DAY)
+        expected = per_row_seeds(seed_engine.minute_datetime(minute), 1)[0]
+        if legacy_seeds(day, 1)[minute_of_day] != expected:
+            bad.append(minute)
+    return bad
+
+
+def write_golden(path, seeds=None):
+    """Save the engine's seeds for the whole range, delta-encoded and compressed"""
+    if seeds is None:
+        seeds = seed_engine.seeds_for_range(0, seed_engine.MINUTE_COUNT)
+    # Consecutive minutes mostly differ by small steps, so the wrapped uint16
+    # deltas compress to a few MB
+    deltas = np.diff(seeds, prepend=np.uint16(0))
+    np.savez_compressed(path, format=GOLDEN_FORMAT, minute_count=seed_engine.MINUTE_COUNT, deltas=deltas)
+
+
+def read_golden(path):
+    with np.load(path) as data:
+        if int(data['format']) != GOLDEN_FORMAT or int(data['minute_count']) != seed_engine.MINUTE_COUNT:
+            raise ValueError(f"{path} is not a golden seed table for this range")
+        return np.cumsum(data['deltas'], dtype=np.uint16)
+
+
+def check_golden(path):
+    """Intervals where the engine no longer matches a golden table"""
+    golden = read_golden(path)
+    intervals = Intervals()
+    for chunk_start, seeds in seed_engine.iter_seed_chunks(0, seed_engine.MINUTE_COUNT):
+        intervals.add(chunk_start, seeds != golden[chunk_start:chunk_start + seeds.size])
+    return intervals
+
+
+def format_interval(lo, hi):
+    first = "{} {}".format(*seed_engine.format_minute(lo))
+    last = "{} {}".format(*seed_engine.format_minute(hi - 1))
+    return f"{first} .. {last} ({hi - lo:,} min)"
+
+
+def report(name, intervals):
+    print(f"{name}: {intervals.minutes:,} minutes in {len(intervals.runs):,} intervals")
+    for lo, hi in intervals.runs[:MAX_PRINTED]:
+        print(f"    {format_interval(lo, hi)}")
+    if len(intervals.runs) > MAX_PRINTED:
+        print(f"    ... {len(intervals.runs) - MAX_PRINTED:,} more")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--write-golden', metavar='FILE', help="save the engine's seeds as a golden table")
+    parser.add_argument('--check-golden', metavar='FILE', help="compare the engine with a saved golden table")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    bad = spot_check()
+    if bad:
+        print(f"vectorized legacy formula disagrees with the per-row loop at {len(bad)} minutes, e.g. "
+              f"{format_interval(bad[0], bad[0] + 1)}")
+        return 1
+    checks = verify()
+    for name, intervals in checks.items():
+        report(name, intervals)
+    failed = any(intervals.runs for name, intervals in checks.items() if 'display' not in name)
+
+    if args.check_golden:
+        intervals = check_golden(args.check_golden)
+        report(f"seed_engine vs {args.check_golden}", intervals)
+        failed = failed or bool(intervals.runs)
+    if args.write_golden:
+        write_golden(args.write_golden)
+        print(f"wrote {args.write_golden}")
+    print(f"{seed_engine.MINUTE_COUNT:,} minutes checked in {time.perf_counter() - started:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,199 @@
+class VirtualTable:
+    """Treeview that only holds the rows currently on screen
+
+    Rows come from a fetch(first, n) callback returning n value tuples, so
+    the table keeps nothing but a start offset and a row count no matter how
+    many rows the source has. On-screen items are kept by row key; scrolling
+    or switching to an overlapping keyed source only fetches, inserts and
+    deletes the rows at the edges of the window.
+    """
+
+    def __init__(self, tree, scrollbar, visible_rows=20, row_height=25, on_select=None):
+        self.tree = tree
+        self.scrollbar = scrollbar
+        self.visible_rows = visible_rows
+        self.row_height = row_height
+        self.count = 0
+        self.top = 0
+        self.fetch = None
+        self.key = None
+        self.keyed = False
+        self.items = {}
+        self.highlight = None
+        self.selected_row = None
+        self.on_select = on_select
+
+        scrollbar.configure(command=self.yview)
+        tree.configure(height=visible_rows)
+        tree.bind('<MouseWheel>', self._on_mousewheel)
+        tree.bind('<Button-4>', lambda e: self.scroll(-3))
+        tree.bind('<Button-5>', lambda e: self.scroll(3))
+        tree.bind('<Up>', lambda e: self._move_selection(-1))
+        tree.bind('<Down>', lambda e: self._move_selection(1))
+        tree.bind('<Prior>', lambda e: self.scroll(-self.visible_rows) or "break")
+        tree.bind('<Next>', lambda e: self.scroll(self.visible_rows) or "break")
+        tree.bind('<Configure>', self._on_resize)
+        tree.bind('<<TreeviewSelect>>', self._on_select)
+
+    def set_source(self, count, fetch, top=0, key=None):
+        """Show `count` rows produced on demand by fetch(first, n)
+
+        key(row) gives a stable identity for a row, such as its absolute
+        minute index. When both the old and new source are keyed, rows with
+        the same key are assumed identical and stay on screen untouched.
+        """
+        keep = key is not None and self.keyed
+        selected_key = None
+        if keep and self.selected_row is not None and self.selected_row < self.count:
+            selected_key = self.key(self.selected_row)
+        if not keep:
+            self.tree.delete(*self.items.values())
+            self.items = {}
+        self.count = count
+        self.fetch = fetch
+        self.key = key or (lambda row: row)
+        self.keyed = key is not None
+        self.top = max(0, min(top, count - self.visible_rows))
+
+        # A selected row that is still in view stays selected
+        row = None
+        if selected_key is not None:
+            for candidate in range(self.top, min(self.top + self.visible_rows, count)):
+                if self.key(candidate) == selected_key:
+                    row = candidate
+                    break
+        if row is None:
+            self._select(None)
+        else:
+            self.selected_row = row
+        self.render()
+
+    def set_count(self, count):
+        """Grow or shrink the current source without moving the view"""
+        self.count = count
+        self.scroll_to(self.top)
+
+    def clear(self):
+        self.set_source(0, None)
+
+    def show_message(self, *values):
+        """Replace the contents with a single informational row"""
+        self.set_source(1, lambda first, n: [values])
+
+    def scroll_to(self, row):
+        """Scroll so `row` is the first visible row"""
+        self.top = max(0, min(row, self.count - self.visible_rows))
+        self.render()
+
+    def scroll(self, rows):
+        self.scroll_to(self.top + rows)
+
+    def see(self, row):
+        """Scroll just enough to make `row` visible"""
+        if row < self.top:
+            self.scroll_to(row)
+        elif row >= self.top + self.visible_rows:
+            self.scroll_to(row - self.visible_rows + 1)
+
+    def yview(self, *args):
+        # Scrollbar protocol: ('moveto', fraction) or ('scroll', n, 'units'|'pages')
+        if args[0] == 'moveto':
+            self.scroll_to(int(float(args[1]) * self.count))
+        elif args[0] == 'scroll':
+            step = self.visible_rows if args[2] == 'pages' else 1
+            self.scroll(int(args[1]) * step)
+
+    def render(self):
+        shown = max(0, min(self.visible_rows, self.count - self.top))
+        keys = [self.key(row) for row in range(self.top, self.top + shown)]
+
+        # Drop the items that left the window
+        wanted = set(keys)
+        for key in [key for key in self.items if key not in wanted]:
+            self.tree.delete(self.items.pop(key))
+
+        # Fetch and insert the missing rows, one contiguous run at a time.
+        # Runs are filled in order, so every position before a run is already
+        # occupied and the run's tree index is its window offset.
+        i = 0
+        while i < shown:
+            if keys[i] in self.items:
+                i += 1
+                continue
+            end = i
+            while end < shown and keys[end] not in self.items:
+                end += 1
+            for offset, values in enumerate(self.fetch(self.top + i, end - i), i):
+                key = keys[offset]
+                self.items[key] = self.tree.insert("", offset, values=values, tags=self.row_tags(key))
+            i = end
+
+        # Selection follows the absolute row, not the item
+        if self.selected_row is not None and self.top <= self.selected_row < self.top + shown:
+            self.tree.selection_set(self.items[keys[self.selected_row - self.top]])
+        else:
+            self.tree.selection_set(())
+
+        if self.count:
+            self.scrollbar.set(self.top / self.count, (self.top + shown) / self.count)
+        else:
+            self.scrollbar.set(0, 1)
+
+    def select(self, row):
+        """Select `row` and scroll it into view"""
+        self._select(row)
+        self.see(row)
+        self.render()
+
+    def selected_values(self):
+        """Values of the selected row, or None"""
+        if self.selected_row is None or self.selected_row >= self.count:
+            return None
+        return self.fetch(self.selected_row, 1)[0]
+
+    def set_highlight(self, key):
+        """Mark the row with this key using the 'current' tag (None to clear)"""
+        previous, self.highlight = self.highlight, key
+        for changed in (previous, key):
+            if changed in self.items:
+                self.tree.item(self.items[changed], tags=self.row_tags(changed))
+
+    def row_tags(self, key):
+        """Tags for a row key; alternates row colours"""
+        if key is not None and key == self.highlight:
+            return ('current',)
+        return ('evenrow' if key % 2 == 0 else 'oddrow',)
+
+    def _on_select(self, event):
+        selection = self.tree.selection()
+        if selection:
+            row = self.top + self.tree.index(selection[0])
+            if row != self.selected_row:
+                self._select(row)
+
+    def _select(self, row):
+        self.selected_row = row
+        if self.on_select:
+            self.on_select(row)
+
+    def _move_selection(self, step):
+        if not self.count:
+            return "break"
+        if self.selected_row is None:
+            row = self.top
+        else:
+            row = max(0, min(self.selected_row + step, self.count - 1))
+        self.select(row)
+        return "break"
+
+    def _on_mousewheel(self, event):
+        # Windows and macOS report the wheel as multiples of 120 / 1
+        delta = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll(-3 * delta)
+
+    def _on_resize(self, event):
+        # One row's worth of height goes to the headings
+        rows = max(1, event.height // self.row_height - 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.scroll_to(self.top)